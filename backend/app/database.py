@@ -1,6 +1,7 @@
 """
 Database connection and session management for SQLAlchemy.
 """
+import io
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -61,3 +62,55 @@ def init_db():
     
     Base.metadata.create_all(bind=engine)
 
+
+def _csv_field(value) -> str:
+    """
+    Format a value for COPY ... (FORMAT csv).
+    
+    None is written unquoted (NULL); everything else is quoted, so an empty
+    string loads as '' instead of NULL.
+    """
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def bulk_copy(db, table, rows):
+    """
+    Bulk load rows into a table within the session's current transaction.
+    
+    On PostgreSQL this streams the rows through COPY ... FROM STDIN, which is
+    much faster than INSERT for large batches (psycopg2 and psycopg 3 drivers).
+    Other dialects and drivers fall back to a single executemany INSERT.
+    
+    Args:
+        db: SQLAlchemy session
+        table: Table to load into (e.g. Student.__table__)
+        rows: List of dicts keyed by column name (all dicts share the same keys)
+    """
+    if not rows:
+        return
+    
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql" or dialect.driver not in ("psycopg2", "psycopg"):
+        db.execute(table.insert(), rows)
+        return
+    
+    columns = list(rows[0].keys())
+    copy_sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+    
+    # Use the session's own DBAPI connection so COPY joins its transaction
+    dbapi_connection = db.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        if dialect.driver == "psycopg":
+            # psycopg 3 adapts each value (including None) itself
+            with cursor.copy(copy_sql) as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+        else:
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write(",".join(_csv_field(row[column]) for column in columns))
+                buffer.write("\n")
+            buffer.seek(0)
+            cursor.copy_expert(f"{copy_sql} WITH (FORMAT csv)", buffer)
@@ -23,7 +23,6 @@ from typing import Dict, List, Tuple, Optional
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-import spacy
 from dotenv import load_dotenv
 
 try:
@@ -37,13 +36,14 @@ from sqlalchemy.exc import IntegrityError
 
 from app.database import SessionLocal, init_db
 from app.models import Student, VocabularyWord, StudentVocabulary
+from spacy_cache import load_nlp
 
 # Load environment variables
 load_dotenv(backend_dir / ".env")
 
-# Load spaCy English model
+# Load spaCy English model (from the serialized cache after the first run)
 try:
-    nlp = spacy.load("en_core_web_sm")
+    nlp = load_nlp("en_core_web_sm")
 except OSError:
     print("Error: spaCy English model not found. Run: python -m spacy download en_core_web_sm")
     sys.exit(1)
@@ -9,10 +9,23 @@ This script:
 - Stores top 3 recommendations per student
 - Aggregates class-wide recommendations
 """
+import math
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Optional: only calculate_match_score_batch needs NumPy
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: JIT-compile the match score (falls back to plain Python/NumPy)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # Add backend directory to path to import app modules
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
@@ -167,33 +180,13 @@ def calculate_vocabulary_overlap(
     return known_words, new_words, overlap_percent
 
 
-def calculate_match_score(
+def _match_score(
     known_percent: float,
-    new_words_count: int,
-    book_reading_level: Optional[float],
+    new_words_count: float,
+    book_reading_level: float,
     student_reading_level: float
 ) -> float:
-    """
-    Calculate match score for a book-student pair.
-    
-    Strategy: Optimize for both high percentage of known words AND high count of new words.
-    This ensures students can comprehend the book (high % known) while learning new vocabulary (high count of new words).
-    
-    Algorithm:
-    - Reward higher percentage of known words (for comprehension/confidence)
-    - Reward higher count of new words (for vocabulary expansion)
-    - Penalize if too easy (>85% known) or too hard (<40% known)
-    - Apply reading level bonus (prefers books at student's level ± 1 grade)
-    
-    Args:
-        known_percent: Percentage of book vocabulary that student knows (0-1)
-        new_words_count: Number of new vocabulary words in the book
-        book_reading_level: Book's reading level (grade level)
-        student_reading_level: Student's reading level (grade level)
-        
-    Returns:
-        Match score between 0 and 1
-    """
+    """Match score kernel (NaN book_reading_level means unknown); see calculate_match_score."""
     known_percent = max(0.0, min(1.0, known_percent))  # Clamp to [0, 1]
     
     # Penalize if too easy (>85% known) or too hard (<40% known)
@@ -204,7 +197,7 @@ def calculate_match_score(
         # Too hard - heavy penalty
         penalty = (0.40 - known_percent) * 3
     else:
-        penalty = 0
+        penalty = 0.0
     
     # Reward higher percentage of known words (for comprehension)
     # Optimal range: 50-75% known, with more granular scoring
@@ -238,9 +231,9 @@ def calculate_match_score(
         new_words_score = new_words_count / 5 * 0.4  # Scale from 0 to 0.4
     
     # Reading level match bonus
-    if book_reading_level is not None:
+    if not math.isnan(book_reading_level):
         reading_level_diff = abs(book_reading_level - student_reading_level)
-        reading_level_score = max(0, 1 - (reading_level_diff / 2))
+        reading_level_score = max(0.0, 1 - (reading_level_diff / 2))
     else:
         # If book has no reading level, give neutral score
         reading_level_score = 0.5
@@ -250,11 +243,133 @@ def calculate_match_score(
     # - 40% weight on new words count (vocabulary expansion)
     # - 20% weight on reading level match
     match_score = (known_score * 0.4) + (new_words_score * 0.4) + (reading_level_score * 0.2) - penalty
-    match_score = max(0, min(1, match_score))  # Clamp to [0, 1]
+    match_score = max(0.0, min(1.0, match_score))  # Clamp to [0, 1]
     
     return match_score
 
 
+def calculate_match_score(
+    known_percent: float,
+    new_words_count: int,
+    book_reading_level: Optional[float],
+    student_reading_level: float
+) -> float:
+    """
+    Calculate match score for a book-student pair.
+    
+    Strategy: Optimize for both high percentage of known words AND high count of new words.
+    This ensures students can comprehend the book (high % known) while learning new vocabulary (high count of new words).
+    
+    Algorithm:
+    - Reward higher percentage of known words (for comprehension/confidence)
+    - Reward higher count of new words (for vocabulary expansion)
+    - Penalize if too easy (>85% known) or too hard (<40% known)
+    - Apply reading level bonus (prefers books at student's level ± 1 grade)
+    
+    Args:
+        known_percent: Percentage of book vocabulary that student knows (0-1)
+        new_words_count: Number of new vocabulary words in the book
+        book_reading_level: Book's reading level (grade level)
+        student_reading_level: Student's reading level (grade level)
+        
+    Returns:
+        Match score between 0 and 1
+    """
+    return _match_score(
+        float(known_percent),
+        float(new_words_count),
+        math.nan if book_reading_level is None else float(book_reading_level),
+        float(student_reading_level),
+    )
+
+
+def calculate_match_score_batch(
+    known_percents,
+    new_words_counts,
+    book_reading_levels,
+    student_reading_levels
+) -> "np.ndarray":
+    """
+    Vectorized calculate_match_score over arrays of book-student pairs.
+    
+    Applies exactly the same penalties, weights and clamping as
+    calculate_match_score, element-wise. Arguments broadcast against each other,
+    so a scalar student reading level can be scored against many books.
+    
+    Args:
+        known_percents: Percentages of book vocabulary that the student knows (0-1)
+        new_words_counts: Numbers of new vocabulary words in each book
+        book_reading_levels: Books' reading levels (None/NaN for unknown)
+        student_reading_levels: Students' reading levels (grade level)
+        
+    Returns:
+        Array of match scores between 0 and 1
+    
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("calculate_match_score_batch requires numpy (pip install numpy)")
+    
+    known = np.asarray(known_percents, dtype=float)
+    new_words = np.asarray(new_words_counts, dtype=float)
+    book_levels = np.asarray(book_reading_levels, dtype=float)  # None -> NaN
+    student_levels = np.asarray(student_reading_levels, dtype=float)
+    
+    if njit is not None:
+        arrays = np.broadcast_arrays(known, new_words, book_levels, student_levels)
+        flat = [np.ascontiguousarray(a).ravel() for a in arrays]
+        return _match_score_batch_jit(*flat).reshape(arrays[0].shape)
+    
+    known = np.clip(known, 0.0, 1.0)
+    
+    penalty = np.select(
+        [known > 0.85, known < 0.40],
+        [(known - 0.85) * 3, (0.40 - known) * 3],
+        0.0,
+    )
+    
+    known_score = np.select(
+        [(known >= 0.50) & (known <= 0.75), known < 0.50],
+        [
+            1.0 - (np.abs(known - 0.625) / 0.125) * 0.15,
+            0.7 + (known - 0.40) / 0.10 * 0.15,
+        ],
+        1.0 - ((known - 0.75) / 0.10) * 0.2,
+    )
+    
+    new_words_score = np.select(
+        [new_words >= 40, new_words >= 20, new_words >= 10, new_words >= 5],
+        [
+            1.0,
+            0.85 + (new_words - 20) / 20 * 0.15,
+            0.7 + (new_words - 10) / 10 * 0.15,
+            0.4 + (new_words - 5) / 5 * 0.3,
+        ],
+        new_words / 5 * 0.4,
+    )
+    
+    reading_level_score = np.where(
+        np.isnan(book_levels),
+        0.5,
+        np.maximum(0, 1 - (np.abs(book_levels - student_levels) / 2)),
+    )
+    
+    match_scores = (known_score * 0.4) + (new_words_score * 0.4) + (reading_level_score * 0.2) - penalty
+    return np.clip(match_scores, 0, 1)
+
+
+if njit is not None:
+    _match_score = njit(cache=True)(_match_score)
+    
+    @njit(parallel=True, cache=True)
+    def _match_score_batch_jit(known, new_words, book_levels, student_levels):
+        scores = np.empty(known.shape[0])
+        for i in prange(known.shape[0]):
+            scores[i] = _match_score(known[i], new_words[i], book_levels[i], student_levels[i])
+        return scores
+
+
 def match_student_to_books(
     db: Session,
     student: Student,
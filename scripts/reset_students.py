@@ -11,11 +11,15 @@ This script:
 Usage:
     python scripts/reset_students.py
     python scripts/reset_students.py --run-analysis
+    python scripts/reset_students.py --yes --quiet --run-analysis
 """
 import argparse
 import json
 import sys
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add backend to Python path
 SCRIPT_DIR = Path(__file__).parent
@@ -23,15 +27,23 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 BACKEND_DIR = PROJECT_ROOT / "backend"
 sys.path.insert(0, str(BACKEND_DIR))
 
-from sqlalchemy.orm import Session
-from app.database import SessionLocal, engine
-from app.models.student import Student
-from app.models.vocabulary import StudentVocabulary
-from app.models.recommendation import StudentRecommendation
+# SQLAlchemy and the app models are imported lazily inside the functions that
+# need them, so --help and an aborted confirmation don't pay their import cost
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 # Paths
 STUDENT_PERSONAS_PATH = PROJECT_ROOT / "data" / "mock" / "student_personas.json"
 
+# Output formatting
+SEPARATOR = "=" * 70
+HEADER = f"{SEPARATOR}\n{{title}}\n{SEPARATOR}"
+BANNER = "\n" + HEADER
+
+# Persona fields required to build a Student row
+PERSONA_FIELDS = ("id", "name", "reading_level", "assigned_grade")
+get_persona_fields = itemgetter(*PERSONA_FIELDS)
+
 
 def load_student_personas():
     """Load the 25 original student personas from JSON."""
@@ -43,71 +55,94 @@ def load_student_personas():
     with open(STUDENT_PERSONAS_PATH, 'r') as f:
         personas = json.load(f)
     
+    # Validate the persona schema once up front instead of per row
+    for index, persona in enumerate(personas):
+        missing = [field for field in PERSONA_FIELDS if field not in persona]
+        if missing:
+            print(f"❌ Error: Persona #{index} is missing fields: {', '.join(missing)}")
+            sys.exit(1)
+    
     print(f"✅ Loaded {len(personas)} student personas from {STUDENT_PERSONAS_PATH}")
     return personas
 
 
-def clear_all_students(db: Session):
-    """Clear all students and related data from the database."""
-    print("\n" + "=" * 70)
-    print("Clearing Database")
-    print("=" * 70)
+def clear_all_students(db: "Session", quiet: bool = False):
+    """
+    Clear all students and related data from the database.
     
-    # Count before deletion
-    student_count = db.query(Student).count()
-    vocab_count = db.query(StudentVocabulary).count()
-    rec_count = db.query(StudentRecommendation).count()
+    When quiet is set, the display-only count queries are skipped.
+    """
+    from app.models.student import Student
+    from app.models.vocabulary import StudentVocabulary
+    from app.models.recommendation import StudentRecommendation
     
-    print(f"\nCurrent database contents:")
-    print(f"  Students: {student_count}")
-    print(f"  Student vocabulary entries: {vocab_count}")
-    print(f"  Student recommendations: {rec_count}")
+    print(BANNER.format(title="Clearing Database"))
+    
+    if not quiet:
+        # Count before deletion
+        student_count = db.query(Student).count()
+        vocab_count = db.query(StudentVocabulary).count()
+        rec_count = db.query(StudentRecommendation).count()
+        
+        print(f"\nCurrent database contents:")
+        print(f"  Students: {student_count}")
+        print(f"  Student vocabulary entries: {vocab_count}")
+        print(f"  Student recommendations: {rec_count}")
     
     # Delete all (cascade will handle related records)
     print(f"\n🗑️  Deleting all students and related data...")
-    db.query(Student).delete()
+    deleted_count = db.query(Student).delete()
     db.commit()
+    print(f"✅ Deleted {deleted_count} students")
     
-    # Verify deletion
-    remaining = db.query(Student).count()
-    print(f"✅ Deleted {student_count} students")
-    print(f"   Remaining students: {remaining}")
+    if not quiet:
+        # Verify deletion
+        remaining = db.query(Student).count()
+        print(f"   Remaining students: {remaining}")
 
 
-def insert_students(db: Session, personas: list):
-    """Insert the 25 original students into the database."""
-    print("\n" + "=" * 70)
-    print("Inserting Students")
-    print("=" * 70)
-    
-    inserted_count = 0
-    
-    for persona in personas:
-        student = Student(
-            id=persona["id"],
-            name=persona["name"],
-            actual_reading_level=float(persona["reading_level"]),
-            assigned_grade=persona["assigned_grade"]
-        )
-        db.add(student)
-        inserted_count += 1
-        print(f"  Added: {student.name} (ID: {student.id}, Reading Level: {student.actual_reading_level})")
+def insert_students(db: "Session", personas: list, quiet: bool = False):
+    """
+    Insert the 25 original students into the database.
+    
+    When quiet is set, the display-only count query is skipped.
+    """
+    from app.database import bulk_copy
+    from app.models.student import Student
     
+    print(BANNER.format(title="Inserting Students"))
+    
+    rows = [
+        {
+            "id": student_id,
+            "name": name,
+            "actual_reading_level": float(reading_level),
+            "assigned_grade": assigned_grade,
+        }
+        for student_id, name, reading_level, assigned_grade in map(get_persona_fields, personas)
+    ]
+    
+    bulk_copy(db, Student.__table__, rows)
     db.commit()
-    print(f"\n✅ Inserted {inserted_count} students")
     
-    # Verify insertion
-    total = db.query(Student).count()
-    print(f"   Total students in database: {total}")
+    for row in rows:
+        print(f"  Added: {row['name']} (ID: {row['id']}, Reading Level: {row['actual_reading_level']})")
+    
+    print(f"\n✅ Inserted {len(rows)} students")
     
-    # Show distribution
+    if not quiet:
+        # Verify insertion
+        total = db.query(Student).count()
+        print(f"   Total students in database: {total}")
+    
+    # Show distribution (computed from the rows we just inserted - no extra queries)
+    level_counts = Counter(row["actual_reading_level"] for row in rows)
     print(f"\n📊 Reading level distribution:")
     for level in [5, 6, 7, 8]:
-        count = db.query(Student).filter(Student.actual_reading_level == level).count()
-        print(f"   Grade {level}: {count} students")
+        print(f"   Grade {level}: {level_counts.get(level, 0)} students")
 
 
-def reset_sequence(db: Session):
+def reset_sequence(db: "Session"):
     """Reset the auto-increment sequence for the students table."""
     print("\n🔄 Resetting ID sequence...")
     
@@ -121,11 +156,13 @@ def reset_sequence(db: Session):
         print("   This is normal if using SQLite or if sequence doesn't exist")
 
 
-def verify_database(db: Session):
+def verify_database(db: "Session"):
     """Verify the database state after reset."""
-    print("\n" + "=" * 70)
-    print("Verification")
-    print("=" * 70)
+    from app.models.student import Student
+    from app.models.vocabulary import StudentVocabulary
+    from app.models.recommendation import StudentRecommendation
+    
+    print(BANNER.format(title="Verification"))
     
     student_count = db.query(Student).count()
     vocab_count = db.query(StudentVocabulary).count()
@@ -150,9 +187,7 @@ def verify_database(db: Session):
 
 def run_analysis():
     """Run the student analysis script."""
-    print("\n" + "=" * 70)
-    print("Running Student Analysis")
-    print("=" * 70)
+    print(BANNER.format(title="Running Student Analysis"))
     print("\nExecuting: python scripts/analyze_students.py")
     
     import subprocess
@@ -173,9 +208,7 @@ def run_analysis():
 
 def run_recommendations():
     """Run the recommendation generation script."""
-    print("\n" + "=" * 70)
-    print("Generating Recommendations")
-    print("=" * 70)
+    print(BANNER.format(title="Generating Recommendations"))
     print("\nExecuting: python scripts/generate_recommendations.py")
     
     import subprocess
@@ -209,12 +242,15 @@ def main():
         action="store_true",
         help="Skip confirmation prompt"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip display-only count queries and the verification step (useful for CI)"
+    )
     
     args = parser.parse_args()
     
-    print("=" * 70)
-    print("Database Reset Script")
-    print("=" * 70)
+    print(HEADER.format(title="Database Reset Script"))
     print("\nThis script will:")
     print("  1. Load the 25 student personas from student_personas.json")
     print("  2. DELETE ALL existing students and related data")
@@ -235,28 +271,29 @@ def main():
     personas = load_student_personas()
     
     # Database operations
+    from app.database import SessionLocal
+    
     db = SessionLocal()
     try:
         # Clear existing data
-        clear_all_students(db)
+        clear_all_students(db, quiet=args.quiet)
         
         # Insert new students
-        insert_students(db, personas)
+        insert_students(db, personas, quiet=args.quiet)
         
         # Reset sequence
         reset_sequence(db)
         
         # Verify
-        verify_database(db)
+        if not args.quiet:
+            verify_database(db)
         
     finally:
         db.close()
     
     # Optionally run analysis and recommendations
     if args.run_analysis:
-        print("\n" + "=" * 70)
-        print("Running Post-Reset Scripts")
-        print("=" * 70)
+        print(BANNER.format(title="Running Post-Reset Scripts"))
         
         if not run_analysis():
             print("\n⚠️  Analysis failed. Skipping recommendations.")
@@ -266,17 +303,13 @@ def main():
             print("\n⚠️  Recommendation generation failed.")
             sys.exit(1)
         
-        print("\n" + "=" * 70)
-        print("✅ Database Reset Complete!")
-        print("=" * 70)
+        print(BANNER.format(title="✅ Database Reset Complete!"))
         print("\nThe database now contains:")
         print("  - 25 students from mock data")
         print("  - Student vocabulary analysis")
         print("  - Book recommendations")
     else:
-        print("\n" + "=" * 70)
-        print("✅ Database Reset Complete!")
-        print("=" * 70)
+        print(BANNER.format(title="✅ Database Reset Complete!"))
         print("\nNext steps:")
         print("  1. Run: python scripts/analyze_students.py")
         print("  2. Run: python scripts/generate_recommendations.py")
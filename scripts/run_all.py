@@ -15,13 +15,28 @@ Usage:
     --only: Run only specific scripts (comma-separated)
 """
 import argparse
-import subprocess
+import asyncio
+import os
+import re
 import sys
+import traceback
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# Output formatting
+SEPARATOR = "=" * 70
+HEADER = f"{SEPARATOR}\n{{title}}\n{SEPARATOR}"
+BANNER = "\n" + HEADER
+
+# Bytes read from a child's output per chunk
+OUTPUT_CHUNK_SIZE = 64 * 1024
+# Complete lines plus a trailing partial line in a chunk
+LINE_PATTERN = re.compile(rb"[^\n]*\n|[^\n]+")
+
 # Script definitions
 SCRIPTS = {
     "vocab": {
@@ -46,6 +61,10 @@ SCRIPTS = {
     }
 }
 
+# Resolve absolute script paths once at import time
+for _script_info in SCRIPTS.values():
+    _script_info["path"] = SCRIPT_DIR / _script_info["script"]
+
 # Statistics tracking
 stats = {
     "vocab": {"words_loaded": 0, "status": "not_run"},
@@ -55,6 +74,47 @@ stats = {
 }
 
 
+async def stream_script_output(script_key: str, script_path: Path) -> int:
+    """
+    Run a script as a subprocess, streaming its output prefixed with the script key.
+    
+    Args:
+        script_key: Key in SCRIPTS dict, used as the line prefix (e.g. "[vocab]")
+        script_path: Absolute path to the script
+        
+    Returns:
+        The subprocess exit code
+    """
+    # Child output is piped, so disable its buffering to keep progress live
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(script_path),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env
+    )
+    
+    prefix = f"[{script_key}] ".encode()
+    sys.stdout.flush()
+    try:
+        # Read fixed-size chunks rather than lines, so a single very long line
+        # (e.g. a JSON dump) can't overrun the StreamReader's line limit
+        at_line_start = True
+        while chunk := await proc.stdout.read(OUTPUT_CHUNK_SIZE):
+            for line in LINE_PATTERN.findall(chunk):
+                sys.stdout.buffer.write(prefix + line if at_line_start else line)
+                at_line_start = line.endswith(b"\n")
+            sys.stdout.buffer.flush()
+    except BaseException:
+        # Don't leave an orphaned child if streaming fails or is cancelled
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        raise
+    
+    return await proc.wait()
+
+
 def run_script(script_key: str, script_info: Dict) -> bool:
     """
     Run a single seeding script.
@@ -69,42 +129,31 @@ def run_script(script_key: str, script_info: Dict) -> bool:
     script_name = script_info["name"]
     script_file = script_info["script"]
     
-    print("\n" + "=" * 70)
-    print(f"Running: {script_name}")
-    print(f"Script: {script_file}")
-    print("=" * 70)
-    
-    # Get script path
-    script_path = Path(__file__).parent / script_file
+    print(BANNER.format(title=f"Running: {script_name}\nScript: {script_file}"))
     
-    if not script_path.exists():
-        print(f"❌ Error: Script not found: {script_path}")
-        stats[script_key]["status"] = "error"
-        return False
+    script_path = script_info["path"]
     
     # Run script as subprocess
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            capture_output=False,  # Let output stream to console
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
-        )
+        returncode = asyncio.run(stream_script_output(script_key, script_path))
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"\n✅ {script_name} completed successfully")
             stats[script_key]["status"] = "success"
             return True
         else:
-            print(f"\n❌ {script_name} failed with exit code {result.returncode}")
+            print(f"\n❌ {script_name} failed with exit code {returncode}")
             stats[script_key]["status"] = "error"
             return False
             
     except Exception as e:
         print(f"\n❌ Error running {script_name}: {e}")
-        stats[script_key]["status"] = "error"
-        import traceback
-        traceback.print_exc()
+        # Keep the traceback for the summary instead of writing it out here
+        stats[script_key].update(
+            status="error",
+            error=repr(e),
+            traceback=traceback.format_exc()
+        )
         return False
 
 
@@ -165,9 +214,7 @@ def determine_scripts_to_run(skip: Optional[str], only: Optional[str]) -> List[s
 
 def print_summary():
     """Print final summary with statistics."""
-    print("\n" + "=" * 70)
-    print("SEEDING PIPELINE SUMMARY")
-    print("=" * 70)
+    print(BANNER.format(title="SEEDING PIPELINE SUMMARY"))
     
     total_scripts = len(SCRIPTS)
     successful = sum(1 for s in stats.values() if s["status"] == "success")
@@ -192,6 +239,14 @@ def print_summary():
         
         print(f"   {status_icon} {script_info['name']}: {status}")
     
+    # Print tracebacks captured from scripts that raised while launching
+    errors = [(key, stats[key]) for key in SCRIPTS if "traceback" in stats[key]]
+    if errors:
+        print(f"\n🐛 Errors:")
+        for key, script_stats in errors:
+            print(f"\n   {SCRIPTS[key]['name']}: {script_stats['error']}")
+            print(script_stats["traceback"], end="")
+    
     # Print statistics (if we had a way to capture them)
     print(f"\n📈 Statistics:")
     print(f"   Vocabulary words: {stats['vocab'].get('words_loaded', 'N/A')}")
@@ -199,7 +254,7 @@ def print_summary():
     print(f"   Students analyzed: {stats['students'].get('students_analyzed', 'N/A')}")
     print(f"   Recommendations generated: {stats['recommendations'].get('recommendations_generated', 'N/A')}")
     
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
     
     if failed > 0:
         print("⚠️  Some scripts failed. Check output above for details.")
@@ -253,10 +308,15 @@ Examples:
         print("❌ Error: No scripts to run")
         sys.exit(1)
     
+    # Check script paths once up front rather than on every run
+    missing = [SCRIPTS[key]["path"] for key in scripts_to_run if not SCRIPTS[key]["path"].exists()]
+    if missing:
+        for script_path in missing:
+            print(f"❌ Error: Script not found: {script_path}")
+        sys.exit(1)
+    
     # Print header
-    print("=" * 70)
-    print("DATABASE SEEDING PIPELINE")
-    print("=" * 70)
+    print(HEADER.format(title="DATABASE SEEDING PIPELINE"))
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\nScripts to run ({len(scripts_to_run)}):")
     for key in scripts_to_run:
@@ -21,10 +21,14 @@ Usage:
 """
 
 import argparse
+import csv
+import functools
+import io
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -32,6 +36,7 @@ from typing import Dict, List, Optional, Tuple
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
@@ -44,6 +49,11 @@ try:
 except ImportError:
     spacy = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from textstat import flesch_kincaid_grade
 except ImportError:
@@ -51,16 +61,39 @@ except ImportError:
 
 # Database imports (only needed for Phase 2)
 try:
-    from app.database import SessionLocal
+    from app.database import SessionLocal, bulk_copy
     from app.models.book import Book, BookVocabulary
     from app.models.vocabulary import VocabularyWord
 except ImportError:
     SessionLocal = None
+    bulk_copy = None
     Book = None
     BookVocabulary = None
     VocabularyWord = None
 
 
+# Metadata columns used by book selection (other columns are never parsed)
+METADATA_COLUMNS = (
+    "gutenberg_id", "id", "PG", "title", "author", "language",
+    "category", "subjects", "bookshelf", "downloads", "download_count",
+)
+
+# Metadata filters, compiled once (word boundaries keep e.g. "French" from matching "en")
+CHILDREN_RE = re.compile(r"children|juvenile", re.IGNORECASE)
+ENGLISH_RE = re.compile(r"\ben\b|\benglish\b", re.IGNORECASE)
+
+# Counts filename patterns: "123", "123.txt", "123_counts.txt", "gutenberg_123.txt", "PG123_counts.txt"
+COUNTS_FILENAME_RE = re.compile(r"(?:PG|gutenberg_)?(\d+)(?:_counts)?(?:\.txt)?$")
+
+# spaCy pipeline used for lemmatization (only needs tok2vec, tagger, attribute_ruler, lemmatizer)
+SPACY_MODEL = "en_core_web_sm"
+SPACY_DISABLE = ["parser", "ner"]
+
+# Lemmas shared across books and persisted between runs
+LEMMA_CACHE_PATH = Path(__file__).parent.parent / "data" / "lemma_cache.json"
+LEMMA_CACHE: Dict[str, str] = {}
+
+
 def find_dataset_path() -> Optional[Path]:
     """Auto-detect dataset path (Zenodo or pgcorpus)."""
     project_root = Path(__file__).parent.parent
@@ -73,9 +106,10 @@ def find_dataset_path() -> Optional[Path]:
             if config.get("dataset_type") == "zenodo_2018":
                 return Path(config["dataset_path"])
     
-    # Check project directory first (preferred location)
+    # Check project directory first (preferred location).
+    # A single stat on the counts child also implies the parent exists.
     project_zenodo = project_root / "data" / "pgcorpus-2018"
-    if project_zenodo.exists() and (project_zenodo / "counts").exists():
+    if (project_zenodo / "counts").is_dir():
         return project_zenodo
     
     # Check common Zenodo locations
@@ -85,7 +119,7 @@ def find_dataset_path() -> Optional[Path]:
         Path("~/datasets/pgcorpus-2018").expanduser(),
     ]
     for path in zenodo_paths:
-        if path.exists() and (path / "counts").exists():
+        if (path / "counts").is_dir():
             return path
     
     # Check for pgcorpus repository
@@ -95,73 +129,75 @@ def find_dataset_path() -> Optional[Path]:
         Path("../gutenberg"),
     ]
     for path in pgcorpus_paths:
-        if path.exists() and (path / "data" / "counts").exists():
+        if (path / "data" / "counts").is_dir():
             return path
     
     return None
 
 
 def find_metadata_csv(dataset_path: Path) -> Optional[Path]:
-    """Find metadata CSV file."""
-    # Check common locations (including Zenodo naming)
-    locations = [
-        dataset_path / "metadata" / "metadata.csv",
-        dataset_path / "metadata.csv",
-        dataset_path / "data" / "metadata.csv",
-        dataset_path / "SPGC-metadata-2018-07-18.csv",  # Zenodo default name
-    ]
-    
-    # Also check for any CSV file in the directory
-    for csv_file in dataset_path.glob("*.csv"):
-        if "metadata" in csv_file.name.lower():
-            return csv_file
-    
-    for loc in locations:
-        if loc.exists():
-            return loc
+    """
+    Find metadata CSV file.
+    
+    Scans the dataset root, then the metadata/ and data/ subdirectories, with one
+    directory read each. Matches metadata.csv as well as the Zenodo default name
+    (SPGC-metadata-2018-07-18.csv).
+    """
+    for directory in (dataset_path, dataset_path / "metadata", dataset_path / "data"):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.endswith(".csv") and "metadata" in name and entry.is_file():
+                        return Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
     
     return None
 
 
-def find_counts_file(dataset_path: Path, gutenberg_id: int) -> Optional[Path]:
-    """Find counts file for a Gutenberg ID."""
-    # Try Zenodo structure first
+@functools.lru_cache(maxsize=None)
+def _counts_index(counts_dir: Path) -> Dict[int, Path]:
+    """Index a counts directory by Gutenberg ID with a single directory scan."""
+    index = {}
+    try:
+        with os.scandir(counts_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                match = COUNTS_FILENAME_RE.match(entry.name)
+                if match:
+                    index.setdefault(int(match.group(1)), Path(entry.path))
+    except FileNotFoundError:
+        pass
+    return index
+
+
+def find_counts_dir(dataset_path: Path) -> Path:
+    """Find the counts directory (Zenodo "counts" or pgcorpus "data/counts")."""
     counts_dir = dataset_path / "counts"
-    if not counts_dir.exists():
-        # Try pgcorpus structure
-        counts_dir = dataset_path / "data" / "counts"
-    
-    if not counts_dir.exists():
-        return None
-    
-    # Try common naming patterns
-    patterns = [
-        f"{gutenberg_id}.txt",
-        f"{gutenberg_id}_counts.txt",
-        f"gutenberg_{gutenberg_id}.txt",
-        f"PG{gutenberg_id}_counts.txt",
-        f"{gutenberg_id}",
-    ]
-    
-    for pattern in patterns:
-        file_path = counts_dir / pattern
-        if file_path.exists() and file_path.is_file():
-            return file_path
-    
-    # Try to find any file starting with the ID
-    for file in counts_dir.glob(f"{gutenberg_id}*"):
-        if file.is_file():
-            return file
-    
-    return None
+    if counts_dir.exists():
+        return counts_dir
+    return dataset_path / "data" / "counts"
 
 
-def load_metadata(metadata_path: Path) -> pd.DataFrame:
-    """Load and parse metadata CSV."""
+def load_metadata(metadata_path: Path, usecols=METADATA_COLUMNS) -> pd.DataFrame:
+    """
+    Load and parse metadata CSV.
+    
+    Only the columns in usecols that exist in the file are parsed. Uses the
+    pyarrow CSV engine when pyarrow is installed, otherwise the C engine.
+    """
     print(f"📊 Loading metadata from: {metadata_path}")
     
     try:
-        df = pd.read_csv(metadata_path, low_memory=False)
+        header = pd.read_csv(metadata_path, nrows=0).columns
+        columns = [col for col in header if col in usecols]
+        try:
+            import pyarrow  # noqa: F401
+            df = pd.read_csv(metadata_path, usecols=columns, engine="pyarrow", dtype_backend="pyarrow")
+        except ImportError:
+            df = pd.read_csv(metadata_path, usecols=columns, low_memory=False)
         print(f"   ✅ Loaded {len(df):,} books")
         return df
     except Exception as e:
@@ -169,6 +205,25 @@ def load_metadata(metadata_path: Path) -> pd.DataFrame:
         raise
 
 
+def _gutenberg_ids(df: pd.DataFrame) -> Optional[pd.Series]:
+    """Numeric Gutenberg IDs (nullable Int64) from the first ID column present, or None."""
+    id_col = next((col for col in ("gutenberg_id", "id", "PG") if col in df.columns), None)
+    if id_col is None:
+        return None
+    # Handle "PG1" format - extract numeric part
+    ids = df[id_col].astype(str).str.extract(r"(\d+)", expand=False)
+    return pd.to_numeric(ids, errors="coerce").astype("Int64")
+
+
+def _contains(series: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Case-insensitive regex match, pushed down to pyarrow compute for arrow-backed columns."""
+    if isinstance(series.dtype, pd.ArrowDtype):
+        return series.str.contains(pattern.pattern, case=False, na=False)
+    if not pd.api.types.is_string_dtype(series):
+        series = series.astype(str)
+    return series.str.contains(pattern, na=False)
+
+
 def filter_books(df: pd.DataFrame, counts_dir: Path) -> pd.DataFrame:
     """Filter books by category, language, and availability."""
     print("\n🔍 Filtering books...")
@@ -185,44 +240,27 @@ def filter_books(df: pd.DataFrame, counts_dir: Path) -> pd.DataFrame:
     
     if category_col:
         # Check for children's literature in the column
-        children_mask = df[category_col].astype(str).str.contains(
-            "Children|children|Juvenile|juvenile", case=False, na=False
-        )
-        df = df[children_mask]
+        df = df[_contains(df[category_col], CHILDREN_RE)]
         print(f"   Category filter: {len(df):,} books (Children's Literature/Fiction)")
     else:
         print("   ⚠️  No category/subjects column found, skipping category filter")
     
     # Filter by language
     if "language" in df.columns:
-        df = df[df["language"].str.contains("en|English", case=False, na=False)]
+        df = df[_contains(df["language"], ENGLISH_RE)]
         print(f"   Language filter: {len(df):,} books (English)")
     else:
         print("   ⚠️  No language column found, skipping language filter")
     
     # Filter by availability (has counts file)
     print("   Checking counts file availability...")
-    available_books = []
-    for idx, row in df.iterrows():
-        gutenberg_id = row.get("gutenberg_id") or row.get("id") or row.get("PG")
-        if pd.isna(gutenberg_id):
-            continue
-        
-        try:
-            # Handle "PG1" format - extract numeric part
-            id_str = str(gutenberg_id).strip()
-            if id_str.startswith("PG"):
-                gutenberg_id = int(id_str[2:])
-            else:
-                gutenberg_id = int(id_str)
-            
-            counts_file = find_counts_file(counts_dir.parent if "data" in str(counts_dir) else counts_dir, gutenberg_id)
-            if counts_file:
-                available_books.append(idx)
-        except (ValueError, TypeError):
-            continue
-    
-    df = df.loc[available_books]
+    available_ids = set(_counts_index(counts_dir))
+    ids = _gutenberg_ids(df)
+    if ids is None:
+        print("   ⚠️  No Gutenberg ID column found")
+        df = df.iloc[0:0]
+    else:
+        df = df[ids.isin(available_ids)]
     print(f"   Availability filter: {len(df):,} books (have counts files)")
     
     print(f"\n   📊 Filtered from {initial_count:,} to {len(df):,} books")
@@ -257,7 +295,7 @@ def phase1_select_books(dataset_path: Path, output_path: Path):
     df = load_metadata(metadata_path)
     
     # Determine counts directory
-    counts_dir = dataset_path / "counts" if (dataset_path / "counts").exists() else dataset_path / "data" / "counts"
+    counts_dir = find_counts_dir(dataset_path)
     
     # Filter books
     df = filter_books(df, counts_dir)
@@ -284,45 +322,27 @@ def phase1_select_books(dataset_path: Path, output_path: Path):
     # Prepare output
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    books_list = []
-    for _, row in selected.iterrows():
-        gutenberg_id = row.get("gutenberg_id") or row.get("id") or row.get("PG")
-        
-        # Handle "PG1" format - extract numeric part
-        gutenberg_id_int = None
-        if not pd.isna(gutenberg_id):
-            try:
-                id_str = str(gutenberg_id).strip()
-                if id_str.startswith("PG"):
-                    gutenberg_id_int = int(id_str[2:])
-                else:
-                    gutenberg_id_int = int(id_str)
-            except (ValueError, TypeError):
-                pass
-        
-        # Handle download count (may be "downloads" column)
-        download_count = None
-        if "download_count" in row:
-            download_count = row.get("download_count")
-        elif "downloads" in row:
-            download_count = row.get("downloads")
-        
-        try:
-            download_count = int(download_count) if not pd.isna(download_count) else None
-        except (ValueError, TypeError):
-            download_count = None
-        
-        book = {
-            "gutenberg_id": gutenberg_id_int,
-            "title": str(row.get("title", "Unknown")),
-            "author": str(row.get("author", "Unknown")),
-            "reading_level": None,  # Would calculate from text
-            "download_count": download_count,
-        }
-        books_list.append(book)
-    
-    with open(output_path, 'w') as f:
-        json.dump(books_list, f, indent=2)
+    # Build the output columns vectorized, then convert once to records
+    ids = _gutenberg_ids(selected)
+    download_col = next((col for col in ("download_count", "downloads") if col in selected.columns), None)
+    downloads = (
+        np.trunc(pd.to_numeric(selected[download_col], errors="coerce").astype("float64")).astype("Int64")
+        if download_col else pd.NA
+    )
+    books_df = pd.DataFrame({
+        "gutenberg_id": ids if ids is not None else pd.NA,
+        "title": selected["title"].astype(str) if "title" in selected.columns else "Unknown",
+        "author": selected["author"].astype(str) if "author" in selected.columns else "Unknown",
+        "reading_level": None,  # Would calculate from text
+        "download_count": downloads,
+    }, index=selected.index).astype(object)
+    books_list = books_df.where(books_df.notna(), None).to_dict(orient="records")
+    
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(books_list, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(books_list, f, indent=2)
     
     print(f"💾 Saved to: {output_path}")
     print(f"   {len(books_list)} books selected")
@@ -330,40 +350,164 @@ def phase1_select_books(dataset_path: Path, output_path: Path):
     return books_list
 
 
-def parse_counts_file(counts_file: Path) -> Dict[str, int]:
-    """Parse counts file (handles different formats)."""
+def _parse_counts_lines(content: str) -> Dict[str, int]:
+    """Parse "word ... count" lines one at a time (tolerates ragged/malformed lines)."""
+    counts = {}
+    for line in content.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            word = parts[0].lower()
+            try:
+                count = int(parts[-1])
+                counts[word] = counts.get(word, 0) + count
+            except ValueError:
+                continue
+    return counts
+
+
+def parse_counts_file(counts_file: Path) -> Tuple[Dict[str, int], Optional[str]]:
+    """
+    Parse counts file (handles different formats).
+    
+    Runs in worker processes, so errors are returned rather than printed and
+    the caller reports them with the book they belong to.
+    
+    Returns:
+        Tuple of (word counts, error message or None)
+    """
     counts = {}
     
     try:
         with open(counts_file, 'r', encoding='utf-8') as f:
-            # Try JSON first
-            try:
-                content = f.read()
-                data = json.loads(content)
-                if isinstance(data, dict):
-                    return data
-            except json.JSONDecodeError:
-                pass
-            
-            # Try space/tab separated
-            f.seek(0)
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = line.split()
-                if len(parts) >= 2:
-                    word = parts[0].lower()
-                    try:
-                        count = int(parts[-1])
-                        counts[word] = counts.get(word, 0) + count
-                    except ValueError:
-                        continue
+            content = f.read()
+        if not content.strip():
+            return counts, None
+        
+        # Try JSON first
+        try:
+            data = json.loads(content)
+            if isinstance(data, dict):
+                return data, None
+        except json.JSONDecodeError:
+            pass
+        
+        # Try space/tab separated: word in the first column, count in the last.
+        # Well-formed files are converted and summed in C; anything ragged or
+        # non-numeric falls back to the line-by-line parser.
+        try:
+            df = pd.read_csv(
+                io.StringIO(content),
+                sep=r"\s+",
+                header=None,
+                engine="c",
+                quoting=csv.QUOTE_NONE,
+                keep_default_na=False,
+                dtype={0: str},
+            )
+        except (pd.errors.ParserError, ValueError):
+            return _parse_counts_lines(content), None
+        if df.shape[1] < 2:
+            return counts, None
+        
+        values = pd.to_numeric(df[df.columns[-1]], errors="coerce")
+        if values.isna().any() or values.dtype.kind != "i":
+            return _parse_counts_lines(content), None
+        
+        counts = values.groupby(df[0].str.lower()).sum().to_dict()
     except Exception as e:
-        print(f"      ⚠️  Error reading counts file: {e}")
+        return counts, str(e)
     
-    return counts
+    return counts, None
+
+
+def lemmatize_words(nlp, words: List[str], batch_size: int = 1000) -> Dict[str, str]:
+    """
+    Lemmatize words in a single batched spaCy pass.
+    
+    Returns:
+        Dict mapping each word to its lowercase lemma
+    """
+    word_to_lemma = {}
+    for word, doc in zip(words, nlp.pipe(words, batch_size=batch_size)):
+        word_to_lemma[word] = sys.intern(doc[0].lemma_.lower() if len(doc) > 0 else word.lower())
+    return word_to_lemma
+
+
+def lemma_cache_key() -> Dict[str, object]:
+    """Identify the spaCy pipeline the cached lemmas came from."""
+    from spacy.util import get_package_version
+    return {
+        "spacy": spacy.__version__,
+        "model": SPACY_MODEL,
+        "model_version": get_package_version(SPACY_MODEL),
+        "disable": sorted(SPACY_DISABLE),
+    }
+
+
+def load_lemma_cache():
+    """Load persisted lemmas from disk into LEMMA_CACHE (ignored if built by another pipeline)."""
+    if not LEMMA_CACHE_PATH.exists():
+        return
+    try:
+        with open(LEMMA_CACHE_PATH, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"   ⚠️  Ignoring unreadable lemma cache: {e}")
+        return
+    
+    if not isinstance(data, dict) or data.get("key") != lemma_cache_key():
+        print("   ⚠️  Ignoring lemma cache built with a different spaCy version or model")
+        return
+    
+    LEMMA_CACHE.update(
+        (sys.intern(word), sys.intern(lemma)) for word, lemma in data["lemmas"].items()
+    )
+    print(f"   ✅ Loaded {len(LEMMA_CACHE):,} cached lemmas from {LEMMA_CACHE_PATH}")
+
+
+def save_lemma_cache():
+    """Persist LEMMA_CACHE to disk so reruns can skip spaCy."""
+    LEMMA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and swap it in, so an interrupted run can't leave a truncated cache
+    tmp_path = LEMMA_CACHE_PATH.with_name(LEMMA_CACHE_PATH.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"key": lemma_cache_key(), "lemmas": LEMMA_CACHE}, f)
+    os.replace(tmp_path, LEMMA_CACHE_PATH)
+
+
+def needs_lemmatization(word: str, vocab_dict: Dict[str, int]) -> bool:
+    """
+    Whether a word has to go through spaCy to find its lemma.
+    
+    Words already in the vocabulary match as-is, and short lowercase
+    alphabetic words are almost always their own lemma.
+    """
+    if word in vocab_dict:
+        return False
+    return not (len(word) < 4 and word.isalpha() and word.islower())
+
+
+def match_vocabulary(counts: Dict[str, int], vocab_series: pd.Series) -> Dict[int, int]:
+    """
+    Map counted words to vocabulary word IDs via their lemmas and sum counts per ID.
+    
+    Args:
+        counts: Word -> occurrence count for one book
+        vocab_series: Vocabulary word IDs indexed by lowercase word
+        
+    Returns:
+        Dict mapping vocabulary word ID to total occurrence count
+    """
+    vocab_index = vocab_series.index
+    lemmas = [word if word in vocab_index else LEMMA_CACHE.get(word, word.lower()) for word in counts]
+    occurrences = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    word_ids = vocab_series.reindex(lemmas).to_numpy()
+    mask = ~pd.isna(word_ids)
+    if not mask.any():
+        return {}
+    
+    totals = pd.Series(occurrences[mask]).groupby(word_ids[mask].astype(np.int64)).sum()
+    return {int(word_id): int(count) for word_id, count in totals.items()}
 
 
 def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
@@ -391,27 +535,66 @@ def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
     
     print(f"📚 Processing {len(books)} books...")
     
-    # Load spaCy model
-    print("🔤 Loading spaCy model...")
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        print("❌ Error: spaCy model not found")
-        print("   Install with: python -m spacy download en_core_web_sm")
-        sys.exit(1)
-    
     # Load vocabulary words from database
     db = SessionLocal()
     vocab_dict = {}
     try:
         vocab_words = db.query(VocabularyWord).all()
-        vocab_dict = {word.word.lower(): word.id for word in vocab_words}
+        # Interned keys let lookups of interned words short-circuit on identity
+        vocab_dict = {sys.intern(word.word.lower()): word.id for word in vocab_words}
         print(f"   ✅ Loaded {len(vocab_dict)} vocabulary words from database")
     finally:
         db.close()
+    vocab_series = pd.Series(vocab_dict, dtype="int64")
     
     # Determine counts directory
-    counts_dir = dataset_path / "counts" if (dataset_path / "counts").exists() else dataset_path / "data" / "counts"
+    counts_dir = find_counts_dir(dataset_path)
+    
+    # Parse every counts file up front so all books share one lemmatization pass.
+    # Parsing is CPU-bound and independent per book, so it runs in worker processes;
+    # database writes stay on the main process.
+    # Same directory index as Phase 1, so every selected book is found again
+    counts_index = _counts_index(counts_dir)
+    counts_files = {}
+    for book_data in books:
+        gutenberg_id = book_data.get("gutenberg_id")
+        if not gutenberg_id:
+            continue
+        counts_file = counts_index.get(gutenberg_id)
+        if counts_file:
+            counts_files[gutenberg_id] = counts_file
+    
+    print(f"📖 Reading {len(counts_files)} counts files...")
+    book_counts = {}
+    counts_errors = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(parse_counts_file, counts_files.values())
+        for gutenberg_id, (counts, error) in zip(counts_files, results):
+            # Strings don't stay interned across pickling, so intern in the main process
+            book_counts[gutenberg_id] = {sys.intern(word): count for word, count in counts.items()}
+            if error is not None:
+                counts_errors[gutenberg_id] = error
+    
+    # Lemmatize only words not already in the persisted cache that actually need it
+    load_lemma_cache()
+    all_words = set().union(*book_counts.values())
+    new_words = [
+        word for word in all_words
+        if word not in LEMMA_CACHE and needs_lemmatization(word, vocab_dict)
+    ]
+    if new_words:
+        print("🔤 Loading spaCy model...")
+        from spacy_cache import load_nlp
+        try:
+            nlp = load_nlp(SPACY_MODEL, disable=SPACY_DISABLE)
+        except OSError:
+            print("❌ Error: spaCy model not found")
+            print("   Install with: python -m spacy download en_core_web_sm")
+            sys.exit(1)
+        
+        print(f"🔤 Lemmatizing {len(new_words):,} new words (of {len(all_words):,} unique)...")
+        LEMMA_CACHE.update(lemmatize_words(nlp, new_words, batch_size=2000))
+        save_lemma_cache()
     
     # Process each book
     db = SessionLocal()
@@ -424,6 +607,12 @@ def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
     }
     
     try:
+        # Prefetch existing books in one SELECT instead of one per book
+        ids = [gutenberg_id for gutenberg_id, counts in book_counts.items() if counts]
+        existing_book_ids = dict(
+            db.query(Book.gutenberg_id, Book.id).filter(Book.gutenberg_id.in_(ids)).all()
+        )
+        
         for i, book_data in enumerate(books, 1):
             gutenberg_id = book_data.get("gutenberg_id")
             if not gutenberg_id:
@@ -433,50 +622,30 @@ def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
             print(f"\n   [{i}/{len(books)}] Processing: {book_data.get('title', 'Unknown')} (ID: {gutenberg_id})")
             
             try:
-                # Find counts file
-                counts_file = find_counts_file(counts_dir.parent if "data" in str(counts_dir) else counts_dir, gutenberg_id)
-                if not counts_file:
+                # Look up counts parsed above
+                if gutenberg_id not in book_counts:
                     print(f"      ❌ Counts file not found")
                     stats['failed'] += 1
                     stats['failed_books'].append({'title': book_data.get('title', 'Unknown'), 'reason': 'Counts file not found'})
                     continue
             
-                # Parse counts
-                counts = parse_counts_file(counts_file)
+                if gutenberg_id in counts_errors:
+                    reason = f"Error reading counts file {counts_files[gutenberg_id].name}: {counts_errors[gutenberg_id]}"
+                    print(f"      ❌ {reason}")
+                    stats['failed'] += 1
+                    stats['failed_books'].append({'title': book_data.get('title', 'Unknown'), 'reason': reason})
+                    continue
+            
+                counts = book_counts[gutenberg_id]
                 if not counts:
                     print(f"      ⚠️  No counts found in file")
                     stats['failed'] += 1
                     stats['failed_books'].append({'title': book_data.get('title', 'Unknown'), 'reason': 'No counts found in file'})
                     continue
             
-                # Lemmatize and match vocabulary
-                # Batch process words for efficiency (spaCy is much faster on batches)
-                matched_vocab = {}
-                total_words = 0
-                
-                # Collect all unique words first
-                unique_words = list(counts.keys())
-                
-                # Batch lemmatize (process in chunks of 1000 for memory efficiency)
-                batch_size = 1000
-                word_to_lemma = {}
-                
-                for i in range(0, len(unique_words), batch_size):
-                    batch = unique_words[i:i + batch_size]
-                    docs = nlp.pipe(batch, batch_size=batch_size, disable=["parser", "ner"])
-                    for word, doc in zip(batch, docs):
-                        lemma = doc[0].lemma_.lower() if len(doc) > 0 else word.lower()
-                        word_to_lemma[word] = lemma
-                
-                # Now match to vocabulary
-                for word, count in counts.items():
-                    total_words += count
-                    lemma = word_to_lemma.get(word, word.lower())
-                    
-                    # Check if in vocabulary
-                    if lemma in vocab_dict:
-                        word_id = vocab_dict[lemma]
-                        matched_vocab[word_id] = matched_vocab.get(word_id, 0) + count
+                # Match vocabulary using the shared lemma cache
+                total_words = sum(counts.values())
+                matched_vocab = match_vocabulary(counts, vocab_series)
                 
                 vocab_match_count = len(matched_vocab)
                 stats['total_vocab_matches'] += vocab_match_count
@@ -489,8 +658,8 @@ def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
                 print(f"      ✅ Found {vocab_match_count} vocabulary matches out of {total_words:,} total words")
             
                 # Insert/update book
-                book = db.query(Book).filter(Book.gutenberg_id == gutenberg_id).first()
-                if not book:
+                book_id = existing_book_ids.get(gutenberg_id)
+                if book_id is None:
                     book = Book(
                         gutenberg_id=gutenberg_id,
                         title=book_data.get("title", "Unknown"),
@@ -500,21 +669,27 @@ def phase2_extract_vocabulary(dataset_path: Path, selected_books_path: Path):
                     )
                     db.add(book)
                     db.flush()
+                    book_id = book.id
                 else:
-                    book.total_words = total_words
-                    # Clear existing vocabulary
-                    db.query(BookVocabulary).filter(BookVocabulary.book_id == book.id).delete()
+                    db.query(Book).filter(Book.id == book_id).update(
+                        {"total_words": total_words}, synchronize_session=False
+                    )
+                    # Replace the old vocabulary in the same transaction, so a
+                    # failed book keeps its previous rows
+                    db.query(BookVocabulary).filter(
+                        BookVocabulary.book_id == book_id
+                    ).delete(synchronize_session=False)
                 
                 # Insert vocabulary matches
-                for word_id, count in matched_vocab.items():
-                    book_vocab = BookVocabulary(
-                        book_id=book.id,
-                        word_id=word_id,
-                        occurrence_count=count,
-                    )
-                    db.add(book_vocab)
+                bulk_copy(db, BookVocabulary.__table__, [
+                    {"book_id": book_id, "word_id": word_id, "occurrence_count": count}
+                    for word_id, count in matched_vocab.items()
+                ])
                 
                 db.commit()
+                # Only remember the id once the book's row is committed, so a
+                # rolled-back insert isn't reused for a duplicate gutenberg_id
+                existing_book_ids[gutenberg_id] = book_id
                 stats['processed'] += 1
                 print(f"      💾 Saved to database")
             
@@ -5,8 +5,7 @@ Seed vocabulary words from grade-level JSON files into the database.
 This script:
 1. Loads vocabulary JSON files from data/vocab/
 2. Handles duplicates (keeps highest grade level)
-3. Applies spaCy lemmatization
-4. Inserts words into vocabulary_words table
+3. Upserts words into vocabulary_words table
 """
 import json
 import sys
@@ -17,20 +16,14 @@ from collections import defaultdict
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import bindparam, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-import spacy
 
 from app.database import SessionLocal, init_db
 from app.models import VocabularyWord
 
-# Load spaCy English model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Error: spaCy English model not found. Run: python -m spacy download en_core_web_sm")
-    sys.exit(1)
-
 
 def load_vocabulary_files(data_dir: Path) -> dict:
     """
@@ -49,7 +42,7 @@ def load_vocabulary_files(data_dir: Path) -> dict:
     }
     
     word_to_grade = {}
-    words_by_grade = defaultdict(list)
+    words_by_grade = defaultdict(set)  # sets keep duplicate upgrades O(1)
     duplicates = []
     
     print("Loading vocabulary files...")
@@ -82,11 +75,13 @@ def load_vocabulary_files(data_dir: Path) -> dict:
                     word_to_grade[word_lower] = grade
                     # Remove from old grade list
                     words_by_grade[old_grade].remove(word_lower)
-                    words_by_grade[grade].append(word_lower)
+                    words_by_grade[grade].add(word_lower)
                 # else: keep existing (higher grade)
             else:
                 word_to_grade[word_lower] = grade
-                words_by_grade[grade].append(word_lower)
+                words_by_grade[grade].add(word_lower)
+    
+    words_by_grade = {grade: list(words) for grade, words in words_by_grade.items()}
     
     print(f"\nTotal unique words: {len(word_to_grade)}")
     if duplicates:
@@ -95,26 +90,69 @@ def load_vocabulary_files(data_dir: Path) -> dict:
     return word_to_grade, words_by_grade, duplicates
 
 
-def lemmatize_word(word: str) -> str:
+def upsert_words_postgresql(db: Session, rows: list) -> tuple:
     """
-    Lemmatize a word using spaCy.
+    Upsert words with one INSERT ... ON CONFLICT statement (PostgreSQL only).
+    
+    Returns:
+        tuple: (inserted count, updated count)
+    """
+    # Keep the highest grade level on conflict; rows whose grade is not higher
+    # are left untouched and not returned. xmax = 0 marks freshly inserted rows.
+    table = VocabularyWord.__table__
+    stmt = insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.word],
+        set_={"grade_level": stmt.excluded.grade_level},
+        where=stmt.excluded.grade_level > table.c.grade_level,
+    ).returning(literal_column("xmax = 0").label("inserted"))
+    
+    inserted = updated = 0
+    for (is_insert,) in db.execute(stmt):
+        if is_insert:
+            inserted += 1
+        else:
+            updated += 1
+    return inserted, updated
+
+
+def upsert_words_generic(db: Session, rows: list) -> tuple:
+    """
+    Upsert words on any dialect: insert new words, upgrade existing ones to a higher grade.
     
-    Args:
-        word: The word to lemmatize
-        
     Returns:
-        str: The lemmatized form of the word
+        tuple: (inserted count, updated count)
     """
-    doc = nlp(word)
-    if len(doc) > 0:
-        return doc[0].lemma_.lower()
-    return word.lower()
+    table = VocabularyWord.__table__
+    existing = dict(db.execute(select(table.c.word, table.c.grade_level)).all())
+    
+    new_rows = [row for row in rows if row["word"] not in existing]
+    upgrades = [
+        {"b_word": row["word"], "b_grade": row["grade_level"]}
+        for row in rows
+        if row["word"] in existing and row["grade_level"] > existing[row["word"]]
+    ]
+    
+    if new_rows:
+        db.execute(table.insert(), new_rows)
+    if upgrades:
+        db.execute(
+            table.update()
+            .where(table.c.word == bindparam("b_word"))
+            .values(grade_level=bindparam("b_grade")),
+            upgrades,
+        )
+    return len(new_rows), len(upgrades)
 
 
 def seed_vocabulary(db: Session, word_to_grade: dict, words_by_grade: dict) -> dict:
     """
     Insert vocabulary words into the database.
     
+    On PostgreSQL this is a single INSERT ... ON CONFLICT (word) DO UPDATE, so
+    existing words are only upgraded when the new grade level is higher. Other
+    dialects apply the same rule with one bulk INSERT and one bulk UPDATE.
+    
     Args:
         db: Database session
         word_to_grade: Dictionary mapping words to grade levels
@@ -133,59 +171,22 @@ def seed_vocabulary(db: Session, word_to_grade: dict, words_by_grade: dict) -> d
     
     print("\nInserting words into database...")
     
-    # Get existing words to check for updates
-    existing_words = {
-        word.word.lower(): word
-        for word in db.query(VocabularyWord).all()
-    }
+    rows = [{"word": word.lower(), "grade_level": grade} for word, grade in word_to_grade.items()]
+    for row in rows:
+        stats["by_grade"][row["grade_level"]] += 1
     
-    # Process words in batches
-    batch_size = 100
-    words_list = list(word_to_grade.items())
+    if db.get_bind().dialect.name == "postgresql":
+        upsert = upsert_words_postgresql
+    else:
+        upsert = upsert_words_generic
     
-    for i in range(0, len(words_list), batch_size):
-        batch = words_list[i:i + batch_size]
-        
-        for word, grade in batch:
-            try:
-                word_lower = word.lower()
-                lemmatized = lemmatize_word(word)
-                
-                # Check if word already exists
-                if word_lower in existing_words:
-                    # Update existing word if grade is higher
-                    existing = existing_words[word_lower]
-                    if grade > existing.grade_level:
-                        existing.grade_level = grade
-                        stats["updated"] += 1
-                    else:
-                        # Word already exists with same or higher grade, skip
-                        stats["by_grade"][grade] += 1
-                        continue
-                else:
-                    # Insert new word
-                    vocab_word = VocabularyWord(
-                        word=word_lower,
-                        grade_level=grade,
-                    )
-                    db.add(vocab_word)
-                    existing_words[word_lower] = vocab_word
-                    stats["inserted"] += 1
-                
-                stats["by_grade"][grade] += 1
-                
-            except Exception as e:
-                print(f"Error processing word '{word}': {e}")
-                stats["errors"] += 1
-                continue
-        
-        # Commit batch
-        try:
-            db.commit()
-        except IntegrityError as e:
-            db.rollback()
-            print(f"Error committing batch: {e}")
-            stats["errors"] += len(batch)
+    try:
+        stats["inserted"], stats["updated"] = upsert(db, rows)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        print(f"Error inserting vocabulary: {e}")
+        stats["errors"] += len(rows)
     
     return stats
 
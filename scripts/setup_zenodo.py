@@ -12,10 +12,79 @@ Usage:
     python scripts/setup_zenodo.py ~/datasets/pgcorpus-2018
 """
 
+import ctypes
+import ctypes.util
+import errno
+import functools
+import json
 import os
+import struct
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# statx(2) constants (linux/stat.h, linux/fcntl.h)
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_SIZE = 0x0200
+STATX_BUFFER_SIZE = 256  # sizeof(struct statx)
+STATX_SIZE_OFFSET = 40  # offsetof(struct statx, stx_size)
+
+
+def _load_statx():
+    """Return libc's statx function, or None if unavailable (non-Linux, old glibc)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+_statx = _load_statx()
+
+
+def _fast_stat_size(path) -> int:
+    """
+    Return a file's size, asking the kernel only for type and size.
+    
+    Uses statx() with AT_STATX_DONT_SYNC so network filesystems can answer from
+    cached attributes; falls back to os.stat() where statx is unavailable.
+    """
+    global _statx
+    if _statx is not None:
+        buf = ctypes.create_string_buffer(STATX_BUFFER_SIZE)
+        result = _statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC, STATX_TYPE | STATX_SIZE, buf)
+        if result == 0:
+            return struct.unpack_from("=Q", buf, STATX_SIZE_OFFSET)[0]
+        if ctypes.get_errno() == errno.ENOSYS:
+            _statx = None  # Kernel older than 4.11
+    return os.stat(path).st_size
+
+
+@functools.cache
+def _default_dataset_path() -> Path:
+    """Default dataset location inside the project (data/pgcorpus-2018)."""
+    return Path(__file__).parent.parent / "data" / "pgcorpus-2018"
+
+
+def _has_counts_dir(dataset_path: Path) -> bool:
+    """Check for dataset_path/counts with a single stat (it implies the parent exists)."""
+    try:
+        os.stat(dataset_path / "counts")
+    except OSError:  # FileNotFoundError, NotADirectoryError, ...
+        return False
+    return True
+
 
 def verify_zenodo_dataset(dataset_path: Path):
     """Verify the Zenodo dataset structure."""
@@ -31,19 +100,29 @@ def verify_zenodo_dataset(dataset_path: Path):
         print("  3. Run this script with the path to the extracted folder")
         sys.exit(1)
     
-    print(f"\n📁 Checking: {dataset_path.absolute()}\n")
+    # Resolve once; every other path is derived from it
+    abs_root = dataset_path.resolve()
+    print(f"\n📁 Checking: {abs_root}\n")
     
     # Check for counts folder
-    counts_dir = dataset_path / "counts"
+    counts_dir = abs_root / "counts"
     if counts_dir.exists():
-        count_files = list(counts_dir.glob("*"))
-        count_files = [f for f in count_files if f.is_file()]
-        print(f"✅ Counts folder found: {len(count_files):,} files")
+        # Stream the directory: only the file count and the first file are needed.
+        # scandir reuses the directory entry type, so is_file() needs no extra stat
+        count_files = 0
+        sample = None
+        with os.scandir(counts_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    if sample is None:
+                        sample = entry
+                    count_files += 1
+        count_str = f"{count_files:,}"
+        print(f"✅ Counts folder found: {count_str} files")
         
-        if count_files:
+        if sample is not None:
             # Check a sample file
-            sample = count_files[0]
-            size = sample.stat().st_size
+            size = _fast_stat_size(sample.path)
             print(f"   Sample file: {sample.name} ({size:,} bytes)")
     else:
         print(f"❌ Counts folder not found: {counts_dir}")
@@ -51,7 +130,8 @@ def verify_zenodo_dataset(dataset_path: Path):
         return False
     
     # Check for metadata
-    metadata_files = list(dataset_path.glob("*.csv"))
+    with os.scandir(abs_root) as it:
+        metadata_files = [entry for entry in it if entry.name.endswith(".csv")]
     if metadata_files:
         print(f"✅ Metadata CSV found: {metadata_files[0].name}")
     else:
@@ -61,8 +141,7 @@ def verify_zenodo_dataset(dataset_path: Path):
     # Check structure
     print(f"\n📊 Dataset Structure:")
     print(f"  {dataset_path}/")
-    if counts_dir.exists():
-        print(f"    ├── counts/ ({len(count_files):,} files)")
+    print(f"    ├── counts/ ({count_str} files)")
     if metadata_files:
         print(f"    └── {metadata_files[0].name}")
     
@@ -76,16 +155,20 @@ def create_config(dataset_path: Path, config_path: Path = None):
     
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
-    import json
+    abs_root = dataset_path.resolve()
+    abs_metadata = abs_root / "metadata.csv"
     config = {
         "dataset_type": "zenodo_2018",
-        "dataset_path": str(dataset_path.absolute()),
-        "counts_path": str((dataset_path / "counts").absolute()),
-        "metadata_path": str((dataset_path / "metadata.csv").absolute()) if (dataset_path / "metadata.csv").exists() else None
+        "dataset_path": str(abs_root),
+        "counts_path": str(abs_root / "counts"),
+        "metadata_path": str(abs_metadata) if abs_metadata.exists() else None
     }
     
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=2)
     
     print(f"\n✅ Created config file: {config_path}")
     print(f"   Scripts can now use this dataset location")
@@ -95,8 +178,7 @@ def main():
     """Main setup function."""
     if len(sys.argv) < 2:
         # Default to project directory
-        project_root = Path(__file__).parent.parent
-        default_path = project_root / "data" / "pgcorpus-2018"
+        default_path = _default_dataset_path()
         
         print("Usage: python setup_zenodo.py [path_to_extracted_zenodo_dataset]")
         print(f"\nDefault location: {default_path}")
@@ -110,7 +192,7 @@ def main():
         print("  4. Run this script")
         
         # Try default path
-        if default_path.exists() and (default_path / "counts").exists():
+        if _has_counts_dir(default_path):
             print(f"\n✅ Found dataset at default location, using: {default_path}")
             dataset_path = default_path
         else:
@@ -0,0 +1,70 @@
+"""
+Load spaCy models through an on-disk cache of the serialized pipeline.
+
+spacy.load() resolves the installed model package, reads its meta/config and
+loads every component from disk on each run. This caches the pipeline config
+and nlp.to_bytes() once per (model, model version, disabled components, spaCy
+version) and rebuilds the pipeline with nlp.from_bytes() on later runs, which shortens the
+cold start of the seeding and analysis scripts.
+
+Usage:
+    from spacy_cache import load_nlp
+    nlp = load_nlp("en_core_web_sm", disable=["parser", "ner"])
+"""
+from pathlib import Path
+from typing import Iterable, Optional
+
+import spacy
+from spacy.util import get_lang_class, get_package_version
+from thinc.api import Config
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "spacy_cache"
+
+
+def _cache_paths(model: str, disable: Iterable[str]):
+    """Return the (config, bytes) cache file paths for a model configuration."""
+    disabled = "-".join(sorted(disable)) or "none"
+    # Include the installed model version so upgrading the model package
+    # invalidates the cache
+    model_version = get_package_version(model) or "unknown"
+    stem = f"{model}-{model_version}-spacy-{spacy.__version__}-disable-{disabled}"
+    return CACHE_DIR / f"{stem}.cfg", CACHE_DIR / f"{stem}.bin"
+
+
+def load_nlp(model: str = "en_core_web_sm", disable: Optional[Iterable[str]] = None):
+    """
+    Load a spaCy pipeline, using the serialized cache when available.
+
+    Args:
+        model: Installed spaCy model name
+        disable: Pipeline components to disable
+
+    Returns:
+        The loaded spaCy Language object
+
+    Raises:
+        OSError: If the model is not cached and not installed (same as spacy.load)
+    """
+    disable = list(disable or [])
+    config_path, bytes_path = _cache_paths(model, disable)
+
+    if config_path.exists() and bytes_path.exists():
+        try:
+            config = Config().from_str(config_path.read_text(encoding="utf-8"))
+            nlp = get_lang_class(config["nlp"]["lang"]).from_config(config, disable=disable)
+            return nlp.from_bytes(bytes_path.read_bytes())
+        except Exception as e:
+            print(f"⚠️  Discarding unreadable spaCy cache ({e}), loading {model} from package")
+            config_path.unlink(missing_ok=True)
+            bytes_path.unlink(missing_ok=True)
+
+    nlp = spacy.load(model, disable=disable)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(nlp.config.to_str(), encoding="utf-8")
+        bytes_path.write_bytes(nlp.to_bytes())
+    except OSError as e:
+        print(f"⚠️  Could not write spaCy cache: {e}")
+
+    return nlp
@@ -8,6 +8,8 @@ Tests:
 - Reading level bonus
 - Edge cases
 """
+import contextlib
+import io
 import sys
 from pathlib import Path
 
@@ -19,7 +21,65 @@ sys.path.insert(0, str(scripts_dir))
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from generate_recommendations import calculate_match_score
+import numpy as np
+
+from generate_recommendations import calculate_match_score, calculate_match_score_batch
+
+# Enough new words to saturate the new-words factor, so these tests isolate the
+# known-percent and reading-level parts of the score
+NEW_WORDS_COUNT = 40
+
+# Score checks: (predicate, pass message, failure message, counts as a failure).
+# Messages are formatted with the case's score and known percent.
+IN_RANGE = (lambda s: 0 <= s <= 1, "Score is in valid range [0, 1]", "❌ Score out of range: {score:.3f}", True)
+VALID = (lambda s: 0 <= s <= 1, "Score is valid", "❌ Score out of range: {score:.3f}", True)
+PENALIZED_EASY = (
+    lambda s: s < 0.5,
+    "Score is penalized (expected for too easy)",
+    "⚠️  Score might be too high for {known:.0%} known: {score:.3f}",
+    False,
+)
+
+
+def run_score_cases(cases) -> bool:
+    """
+    Score a table of cases in one batched call and report each case's checks.
+    
+    Args:
+        cases: List of (description, known_percent, book_level, student_level, checks)
+    
+    Returns:
+        True if no failing check is marked as a failure
+    """
+    _, known_pcts, book_levels, student_levels, _ = zip(*cases)
+    scores = calculate_match_score_batch(known_pcts, NEW_WORDS_COUNT, book_levels, student_levels)
+    
+    all_passed = True
+    for i, ((description, known_pct, book_level, student_level, checks), score) in enumerate(zip(cases, scores), 1):
+        print(f"\n{i}. Testing {description}...")
+        if book_level is None:
+            print(f"   Known: {known_pct:.0%}, Reading level: None")
+        else:
+            print(f"   Known: {known_pct:.0%}, Reading level diff: {abs(book_level - student_level):.1f}")
+        print(f"   Match score: {score:.3f}")
+    
+        for predicate, passed_msg, failed_msg, required in checks:
+            if predicate(score):
+                print(f"   ✅ {passed_msg}")
+            else:
+                print(f"   {failed_msg.format(score=score, known=known_pct)}")
+                if required:
+                    all_passed = False
+                    break
+    
+    return all_passed
+
+
+def print_result(all_passed: bool, passed_msg: str, warning_msg: str = "⚠️  SOME TESTS HAD WARNINGS"):
+    """Print a test's closing banner."""
+    print("\n" + "=" * 70)
+    print(passed_msg if all_passed else warning_msg)
+    print("=" * 70)
 
 
 def test_match_score_calculation():
@@ -28,159 +88,56 @@ def test_match_score_calculation():
     print("TEST 2.1: Match Score Calculation")
     print("=" * 70)
     
-    all_passed = True
-    
-    # Test 1: Perfect match (50% known, same reading level)
-    print("\n1. Testing perfect match (50% known, same reading level)...")
-    score = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 50%, Reading level diff: 0.0")
-    print(f"   Match score: {score:.3f}")
-    if score > 0.8:  # Should be high for perfect match
-        print("   ✅ Score is high (expected for perfect match)")
-    else:
-        print(f"   ⚠️  Score is lower than expected: {score:.3f}")
-        all_passed = False
-    
-    # Test 2: Too easy (90% known)
-    print("\n2. Testing too easy book (90% known)...")
-    score = calculate_match_score(
-        known_percent=0.9,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 90%, Reading level diff: 0.0")
-    print(f"   Match score: {score:.3f}")
-    if score < 0.5:  # Should be penalized
-        print("   ✅ Score is penalized (expected for too easy)")
-    else:
-        print(f"   ⚠️  Score should be lower for too easy book: {score:.3f}")
-        all_passed = False
-    
-    # Test 3: Too hard (20% known)
-    print("\n3. Testing too hard book (20% known)...")
-    score = calculate_match_score(
-        known_percent=0.2,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 20%, Reading level diff: 0.0")
-    print(f"   Match score: {score:.3f}")
-    if score < 0.5:  # Should be penalized
-        print("   ✅ Score is penalized (expected for too hard)")
-    else:
-        print(f"   ⚠️  Score should be lower for too hard book: {score:.3f}")
-        all_passed = False
+    cases = [
+        ("perfect match (50% known, same reading level)", 0.5, 7.0, 7.0, [
+            (lambda s: s > 0.8, "Score is high (expected for perfect match)",
+             "⚠️  Score is lower than expected: {score:.3f}", True),
+        ]),
+        ("too easy book (90% known)", 0.9, 7.0, 7.0, [
+            (lambda s: s < 0.5, "Score is penalized (expected for too easy)",
+             "⚠️  Score should be lower for too easy book: {score:.3f}", True),
+        ]),
+        ("too hard book (20% known)", 0.2, 7.0, 7.0, [
+            (lambda s: s < 0.5, "Score is penalized (expected for too hard)",
+             "⚠️  Score should be lower for too hard book: {score:.3f}", True),
+        ]),
+        ("reading level match (1 grade difference)", 0.5, 8.0, 7.0, [
+            (lambda s: s > 0.6, "Score is good (expected for ±1 grade)",
+             "⚠️  Score might be too low: {score:.3f}", True),
+        ]),
+        ("edge case: 0% known", 0.0, 7.0, 7.0, [IN_RANGE]),
+        ("edge case: 100% known", 1.0, 7.0, 7.0, [IN_RANGE, PENALIZED_EASY]),
+        ("edge case: book with no reading level", 0.5, None, 7.0, [IN_RANGE]),
+    ]
+    all_passed = run_score_cases(cases)
     
-    # Test 4: Reading level mismatch (2 grades difference)
-    print("\n4. Testing reading level mismatch (2 grades difference)...")
-    score = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=9.0,
-        student_reading_level=7.0
-    )
+    # Reading level mismatch (2 grades difference) should score below the same level
+    print(f"\n{len(cases) + 1}. Testing reading level mismatch (2 grades difference)...")
+    score, score_same_level = calculate_match_score_batch(0.5, NEW_WORDS_COUNT, [9.0, 7.0], 7.0)
     print(f"   Known: 50%, Reading level diff: 2.0")
     print(f"   Match score: {score:.3f}")
-    score_same_level = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    if score < score_same_level:  # Should be lower than same level
+    if score < score_same_level:
         print(f"   ✅ Score is lower with level mismatch ({score:.3f} < {score_same_level:.3f})")
     else:
         print(f"   ⚠️  Score should be lower with level mismatch")
         all_passed = False
     
-    # Test 5: Reading level match (1 grade difference - acceptable)
-    print("\n5. Testing reading level match (1 grade difference)...")
-    score = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=8.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 50%, Reading level diff: 1.0")
-    print(f"   Match score: {score:.3f}")
-    if score > 0.6:  # Should still be good
-        print("   ✅ Score is good (expected for ±1 grade)")
-    else:
-        print(f"   ⚠️  Score might be too low: {score:.3f}")
-        all_passed = False
-    
-    # Test 6: Edge case - 0% known
-    print("\n6. Testing edge case: 0% known...")
-    score = calculate_match_score(
-        known_percent=0.0,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 0%, Reading level diff: 0.0")
-    print(f"   Match score: {score:.3f}")
-    if 0 <= score <= 1:  # Should be in valid range
-        print("   ✅ Score is in valid range [0, 1]")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Test 7: Edge case - 100% known
-    print("\n7. Testing edge case: 100% known...")
-    score = calculate_match_score(
-        known_percent=1.0,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 100%, Reading level diff: 0.0")
-    print(f"   Match score: {score:.3f}")
-    if 0 <= score <= 1:  # Should be in valid range
-        print("   ✅ Score is in valid range [0, 1]")
-        if score < 0.5:  # Should be penalized
-            print("   ✅ Score is penalized (expected for too easy)")
-        else:
-            print(f"   ⚠️  Score might be too high for 100% known: {score:.3f}")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Test 8: Edge case - no reading level
-    print("\n8. Testing edge case: book with no reading level...")
-    score = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=None,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 50%, Reading level: None")
-    print(f"   Match score: {score:.3f}")
-    if 0 <= score <= 1:  # Should be in valid range
-        print("   ✅ Score is in valid range [0, 1]")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Test 9: Optimal range (40-60% known)
-    print("\n9. Testing optimal range (40-60% known)...")
-    scores = []
-    for known_pct in [0.4, 0.45, 0.5, 0.55, 0.6]:
-        score = calculate_match_score(
-            known_percent=known_pct,
-            book_reading_level=7.0,
-            student_reading_level=7.0
-        )
-        scores.append((known_pct, score))
+    # Optimal range (40-60% known)
+    print(f"\n{len(cases) + 2}. Testing optimal range (40-60% known)...")
+    known_pcts = np.array([0.4, 0.45, 0.5, 0.55, 0.6])
+    scores = calculate_match_score_batch(known_pcts, NEW_WORDS_COUNT, 7.0, 7.0)
+    for known_pct, score in zip(known_pcts, scores):
         print(f"   Known: {known_pct:.0%}, Score: {score:.3f}")
     
-    # Check that scores are relatively high in this range
-    avg_score = sum(s for _, s in scores) / len(scores)
+    avg_score = scores.mean()
     if avg_score > 0.6:
         print(f"   ✅ Average score in optimal range is good: {avg_score:.3f}")
     else:
         print(f"   ⚠️  Average score might be too low: {avg_score:.3f}")
         all_passed = False
     
-    # Test 10: Verify score is always in [0, 1] range
-    print("\n10. Testing score clamping to [0, 1] range...")
+    # Score is always in [0, 1] and the batch scorer agrees with the scalar one
+    print(f"\n{len(cases) + 3}. Testing score clamping to [0, 1] range...")
     test_cases = [
         (0.0, 7.0, 7.0),
         (0.3, 7.0, 7.0),
@@ -190,28 +147,45 @@ def test_match_score_calculation():
         (0.5, 5.0, 7.0),
         (0.5, 10.0, 7.0),
     ]
-    all_in_range = True
-    for known_pct, book_level, student_level in test_cases:
-        score = calculate_match_score(known_pct, book_level, student_level)
-        if not (0 <= score <= 1):
-            print(f"   ❌ Score out of range: {score:.3f} (known={known_pct:.0%}, book={book_level}, student={student_level})")
-            all_in_range = False
-    
-    if all_in_range:
+    known_pcts, book_levels, student_levels = zip(*test_cases)
+    scores = calculate_match_score_batch(known_pcts, NEW_WORDS_COUNT, book_levels, student_levels)
+    out_of_range = [
+        (case, score) for case, score in zip(test_cases, scores) if not (0 <= score <= 1)
+    ]
+    for (known_pct, book_level, student_level), score in out_of_range:
+        print(f"   ❌ Score out of range: {score:.3f} (known={known_pct:.0%}, book={book_level}, student={student_level})")
+    if not out_of_range:
         print("   ✅ All scores are in valid range [0, 1]")
     else:
         all_passed = False
     
-    print("\n" + "=" * 70)
-    if all_passed:
-        print("✅ ALL MATCH SCORE CALCULATION TESTS PASSED")
+    scalar_scores = [
+        calculate_match_score(known_pct, NEW_WORDS_COUNT, book_level, student_level)
+        for known_pct, book_level, student_level in test_cases
+    ]
+    if np.allclose(scores, scalar_scores):
+        print("   ✅ Batch scores match calculate_match_score")
     else:
-        print("⚠️  SOME TESTS HAD WARNINGS (algorithm may need tuning)")
-    print("=" * 70)
+        print("   ❌ Batch scores differ from calculate_match_score")
+        all_passed = False
     
+    print_result(
+        all_passed,
+        "✅ ALL MATCH SCORE CALCULATION TESTS PASSED",
+        "⚠️  SOME TESTS HAD WARNINGS (algorithm may need tuning)",
+    )
     return all_passed
 
 
+def score_sweep(known_pcts) -> list:
+    """Score a sweep of known percentages at a matching reading level and print it."""
+    known_pcts = np.array(known_pcts)
+    scores = calculate_match_score_batch(known_pcts, NEW_WORDS_COUNT, 7.0, 7.0)
+    for known_pct, score in zip(known_pcts, scores):
+        print(f"   Known: {known_pct:.0%}, Score: {score:.3f}")
+    return list(scores)
+
+
 def test_penalty_logic():
     """Test penalty logic for too easy/hard books."""
     print("\n" + "=" * 70)
@@ -220,47 +194,19 @@ def test_penalty_logic():
     
     all_passed = True
     
-    # Test penalty for too easy (>80% known)
+    # Test penalty for too easy (>80% known): scores should decrease as known percent increases
     print("\n1. Testing penalty for too easy books (>80% known)...")
-    easy_scores = []
-    for known_pct in [0.81, 0.85, 0.9, 0.95, 1.0]:
-        score = calculate_match_score(
-            known_percent=known_pct,
-            book_reading_level=7.0,
-            student_reading_level=7.0
-        )
-        easy_scores.append((known_pct, score))
-        print(f"   Known: {known_pct:.0%}, Score: {score:.3f}")
-    
-    # Check that scores decrease as known percent increases above 80%
-    decreasing = all(
-        easy_scores[i][1] >= easy_scores[i+1][1]
-        for i in range(len(easy_scores) - 1)
-    )
-    if decreasing:
+    easy_scores = score_sweep([0.81, 0.85, 0.9, 0.95, 1.0])
+    if all(a >= b for a, b in zip(easy_scores, easy_scores[1:])):
         print("   ✅ Scores decrease as known percent increases (penalty working)")
     else:
         print("   ⚠️  Penalty may not be strong enough")
         all_passed = False
     
-    # Test penalty for too hard (<30% known)
+    # Test penalty for too hard (<30% known): scores should increase as known percent increases
     print("\n2. Testing penalty for too hard books (<30% known)...")
-    hard_scores = []
-    for known_pct in [0.0, 0.1, 0.2, 0.25, 0.29]:
-        score = calculate_match_score(
-            known_percent=known_pct,
-            book_reading_level=7.0,
-            student_reading_level=7.0
-        )
-        hard_scores.append((known_pct, score))
-        print(f"   Known: {known_pct:.0%}, Score: {score:.3f}")
-    
-    # Check that scores increase as known percent increases (less penalty)
-    increasing = all(
-        hard_scores[i][1] <= hard_scores[i+1][1]
-        for i in range(len(hard_scores) - 1)
-    )
-    if increasing:
+    hard_scores = score_sweep([0.0, 0.1, 0.2, 0.25, 0.29])
+    if all(a <= b for a, b in zip(hard_scores, hard_scores[1:])):
         print("   ✅ Scores increase as known percent increases (penalty decreasing)")
     else:
         print("   ⚠️  Penalty behavior may need adjustment")
@@ -268,34 +214,15 @@ def test_penalty_logic():
     
     # Test sweet spot (30-80% known, no penalty)
     print("\n3. Testing sweet spot (30-80% known, no penalty)...")
-    sweet_spot_scores = []
-    for known_pct in [0.3, 0.4, 0.5, 0.6, 0.7, 0.8]:
-        score = calculate_match_score(
-            known_percent=known_pct,
-            book_reading_level=7.0,
-            student_reading_level=7.0
-        )
-        sweet_spot_scores.append((known_pct, score))
-        print(f"   Known: {known_pct:.0%}, Score: {score:.3f}")
-    
-    # Check that scores are relatively high in sweet spot
-    avg_sweet = sum(s for _, s in sweet_spot_scores) / len(sweet_spot_scores)
-    avg_easy = sum(s for _, pct in easy_scores for s in [pct]) / len(easy_scores) if easy_scores else 0
-    avg_hard = sum(s for _, pct in hard_scores for s in [pct]) / len(hard_scores) if hard_scores else 0
-    
+    sweet_spot_scores = score_sweep([0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+    avg_sweet = sum(sweet_spot_scores) / len(sweet_spot_scores)
     if avg_sweet > 0.5:
         print(f"   ✅ Average score in sweet spot is good: {avg_sweet:.3f}")
     else:
         print(f"   ⚠️  Average score in sweet spot might be too low: {avg_sweet:.3f}")
         all_passed = False
     
-    print("\n" + "=" * 70)
-    if all_passed:
-        print("✅ ALL PENALTY LOGIC TESTS PASSED")
-    else:
-        print("⚠️  SOME TESTS HAD WARNINGS")
-    print("=" * 70)
-    
+    print_result(all_passed, "✅ ALL PENALTY LOGIC TESTS PASSED")
     return all_passed
 
 
@@ -308,43 +235,25 @@ def test_reading_level_bonus():
     all_passed = True
     student_level = 7.0
     
-    # Test same reading level (should get highest bonus)
+    book_levels = [7.0, 8.0, 6.0, 9.0, 5.0, None]
+    (
+        score_same,
+        score_plus1,
+        score_minus1,
+        score_plus2,
+        score_minus2,
+        score_no_level,
+    ) = calculate_match_score_batch(0.5, NEW_WORDS_COUNT, book_levels, student_level)
+    
     print("\n1. Testing same reading level...")
-    score_same = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=7.0,
-        student_reading_level=student_level
-    )
     print(f"   Book level: 7.0, Student level: {student_level}")
     print(f"   Score: {score_same:.3f}")
     
-    # Test ±1 grade (should still be good)
     print("\n2. Testing ±1 grade difference...")
-    score_plus1 = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=8.0,
-        student_reading_level=student_level
-    )
-    score_minus1 = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=6.0,
-        student_reading_level=student_level
-    )
     print(f"   Book level: 8.0, Score: {score_plus1:.3f}")
     print(f"   Book level: 6.0, Score: {score_minus1:.3f}")
     
-    # Test ±2 grades (should be lower)
     print("\n3. Testing ±2 grade difference...")
-    score_plus2 = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=9.0,
-        student_reading_level=student_level
-    )
-    score_minus2 = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=5.0,
-        student_reading_level=student_level
-    )
     print(f"   Book level: 9.0, Score: {score_plus2:.3f}")
     print(f"   Book level: 5.0, Score: {score_minus2:.3f}")
     
@@ -361,13 +270,7 @@ def test_reading_level_bonus():
         print("   ⚠️  ±1 grade should get better score than ±2")
         all_passed = False
     
-    # Test with no reading level
     print("\n4. Testing book with no reading level...")
-    score_no_level = calculate_match_score(
-        known_percent=0.5,
-        book_reading_level=None,
-        student_reading_level=student_level
-    )
     print(f"   Book level: None, Score: {score_no_level:.3f}")
     if 0 <= score_no_level <= 1:
         print("   ✅ Score is valid (neutral reading level score applied)")
@@ -375,13 +278,7 @@ def test_reading_level_bonus():
         print(f"   ❌ Score out of range: {score_no_level:.3f}")
         all_passed = False
     
-    print("\n" + "=" * 70)
-    if all_passed:
-        print("✅ ALL READING LEVEL BONUS TESTS PASSED")
-    else:
-        print("⚠️  SOME TESTS HAD WARNINGS")
-    print("=" * 70)
-    
+    print_result(all_passed, "✅ ALL READING LEVEL BONUS TESTS PASSED")
     return all_passed
 
 
@@ -391,85 +288,42 @@ def test_edge_cases():
     print("TEST 2.4: Edge Cases")
     print("=" * 70)
     
-    all_passed = True
-    
-    # Edge case 1: Student with 0% vocabulary mastery
-    print("\n1. Testing student with 0% vocabulary mastery...")
-    score = calculate_match_score(
-        known_percent=0.0,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 0%, Score: {score:.3f}")
-    if 0 <= score <= 1:
-        print("   ✅ Score is valid")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Edge case 2: Student with 100% vocabulary mastery
-    print("\n2. Testing student with 100% vocabulary mastery...")
-    score = calculate_match_score(
-        known_percent=1.0,
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 100%, Score: {score:.3f}")
-    if 0 <= score <= 1:
-        print("   ✅ Score is valid")
-        if score < 0.5:
-            print("   ✅ Score is penalized (expected for too easy)")
-        else:
-            print(f"   ⚠️  Score might be too high for 100% known: {score:.3f}")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Edge case 3: Book with very low vocabulary coverage
-    print("\n3. Testing book with very low vocabulary coverage...")
-    # This would be tested with actual book data, but we can test with low known percent
-    score = calculate_match_score(
-        known_percent=0.05,  # Very few known words
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 5%, Score: {score:.3f}")
-    if 0 <= score <= 1:
-        print("   ✅ Score is valid")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    # Edge case 4: Book with very high vocabulary coverage
-    print("\n4. Testing book with very high vocabulary coverage...")
-    score = calculate_match_score(
-        known_percent=0.95,  # Almost all words known
-        book_reading_level=7.0,
-        student_reading_level=7.0
-    )
-    print(f"   Known: 95%, Score: {score:.3f}")
-    if 0 <= score <= 1:
-        print("   ✅ Score is valid")
-        if score < 0.5:
-            print("   ✅ Score is penalized (expected for too easy)")
-        else:
-            print(f"   ⚠️  Score might be too high for 95% known: {score:.3f}")
-    else:
-        print(f"   ❌ Score out of range: {score:.3f}")
-        all_passed = False
-    
-    print("\n" + "=" * 70)
-    if all_passed:
-        print("✅ ALL EDGE CASE TESTS PASSED")
-    else:
-        print("⚠️  SOME TESTS HAD WARNINGS")
-    print("=" * 70)
+    cases = [
+        ("student with 0% vocabulary mastery", 0.0, 7.0, 7.0, [VALID]),
+        ("student with 100% vocabulary mastery", 1.0, 7.0, 7.0, [VALID, PENALIZED_EASY]),
+        # Stands in for a book with very low vocabulary coverage (few known words)
+        ("book with very low vocabulary coverage", 0.05, 7.0, 7.0, [VALID]),
+        ("book with very high vocabulary coverage", 0.95, 7.0, 7.0, [VALID, PENALIZED_EASY]),
+    ]
+    all_passed = run_score_cases(cases)
     
+    print_result(all_passed, "✅ ALL EDGE CASE TESTS PASSED")
     return all_passed
 
 
+def run_buffered(test_fn) -> bool:
+    """Run a test with its output collected in memory, encoded once and written in one call."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return test_fn()
+    finally:
+        text = buffer.getvalue()
+        raw = getattr(sys.stdout, "buffer", None)
+        if raw is None:
+            # Replaced stdout (pytest capture, IDE runners, StringIO): write text as-is
+            sys.stdout.write(text)
+        else:
+            sys.stdout.flush()
+            raw.write(text.encode(sys.stdout.encoding or "utf-8", "backslashreplace"))
+
+
 def main():
     """Run all algorithm verification tests."""
+    # Don't fail on emoji when stdout isn't UTF-8 (e.g. Windows consoles, some CI logs)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="backslashreplace")
+    
     print("=" * 70)
     print("ALGORITHM VERIFICATION TESTS")
     print("=" * 70)
@@ -477,10 +331,10 @@ def main():
     results = []
     
     # Run all tests
-    results.append(("Match Score Calculation", test_match_score_calculation()))
-    results.append(("Penalty Logic", test_penalty_logic()))
-    results.append(("Reading Level Bonus", test_reading_level_bonus()))
-    results.append(("Edge Cases", test_edge_cases()))
+    results.append(("Match Score Calculation", run_buffered(test_match_score_calculation)))
+    results.append(("Penalty Logic", run_buffered(test_penalty_logic)))
+    results.append(("Reading Level Bonus", run_buffered(test_reading_level_bonus)))
+    results.append(("Edge Cases", run_buffered(test_edge_cases)))
     
     # Summary
     print("\n" + "=" * 70)
@@ -503,4 +357,3 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -8,121 +8,160 @@ This script verifies:
 3. Data structure matches frontend expectations
 """
 import sys
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add backend to path
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import distinct, func
+
 from app.database import SessionLocal
 from app.services.class_service import get_class_stats, get_class_recommendations
 from app.models.student import Student
 from app.models.vocabulary import StudentVocabulary
 from app.models.recommendation import StudentRecommendation
 
-def check_backend_api():
+
+def run_with_session(fn):
+    """Call fn(db) with its own session (sessions must not be shared across threads)."""
+    db = SessionLocal()
+    try:
+        return fn(db)
+    finally:
+        db.close()
+
+
+def get_database_counts(db) -> dict:
+    """Fetch table counts and the reading level histogram."""
+    # Fetch all table counts in a single round trip
+    (
+        student_count,
+        vocab_count,
+        students_with_vocab,
+        rec_count,
+        students_with_recs,
+    ) = db.query(
+        db.query(func.count()).select_from(Student).scalar_subquery(),
+        db.query(func.count()).select_from(StudentVocabulary).scalar_subquery(),
+        db.query(func.count(distinct(StudentVocabulary.student_id))).scalar_subquery(),
+        db.query(func.count()).select_from(StudentRecommendation).scalar_subquery(),
+        db.query(func.count(distinct(StudentRecommendation.student_id))).scalar_subquery(),
+    ).one()
+    
+    level_counts = Counter(dict(
+        db.query(Student.actual_reading_level, func.count())
+        .group_by(Student.actual_reading_level)
+        .all()
+    ))
+    
+    return {
+        "student_count": student_count,
+        "vocab_count": vocab_count,
+        "students_with_vocab": students_with_vocab,
+        "rec_count": rec_count,
+        "students_with_recs": students_with_recs,
+        "level_counts": level_counts,
+    }
+
+
+def check_backend_api(stats, recs):
     """Verify backend API endpoints work correctly."""
     print("=" * 70)
     print("1. Backend API Verification")
     print("=" * 70)
     
-    db = SessionLocal()
-    try:
-        # Test class stats
-        print("\n📊 Testing /api/class/stats...")
-        stats = get_class_stats(db)
-        
-        checks = []
-        checks.append(("Total students", stats.total_students == 25, f"Found {stats.total_students}, expected 25"))
-        checks.append(("Average mastery", 0 <= stats.avg_vocab_mastery_percent <= 100, f"Found {stats.avg_vocab_mastery_percent:.1f}%"))
-        checks.append(("Reading level distribution", len(stats.reading_level_distribution) > 0, f"Found {len(stats.reading_level_distribution)} levels"))
-        checks.append(("Top missing words", len(stats.top_missing_words) > 0, f"Found {len(stats.top_missing_words)} words"))
-        checks.append(("Commonly misused words", len(stats.commonly_misused_words) >= 0, f"Found {len(stats.commonly_misused_words)} words"))
-        
-        for name, passed, msg in checks:
-            status = "✅" if passed else "❌"
-            print(f"   {status} {name}: {msg}")
-        
-        # Test class recommendations
-        print("\n📖 Testing /api/class/recommendations...")
-        recs = get_class_recommendations(db)
-        
-        rec_checks = []
-        rec_checks.append(("Recommendations exist", len(recs) > 0, f"Found {len(recs)} recommendations"))
-        rec_checks.append(("Max 2 recommendations", len(recs) <= 2, f"Found {len(recs)}, max is 2"))
-        
-        if recs:
-            rec_checks.append(("Book titles present", all(r.title for r in recs), "All have titles"))
-            rec_checks.append(("Student counts valid", all(0 < r.students_recommended_count <= 25 for r in recs), "All counts valid"))
-            rec_checks.append(("Match scores valid", all(0 <= r.avg_match_score <= 1 for r in recs), "All scores valid"))
-        
-        for name, passed, msg in rec_checks:
-            status = "✅" if passed else "❌"
-            print(f"   {status} {name}: {msg}")
-        
-        return all(p for _, p, _ in checks + rec_checks)
-        
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    if stats is None or recs is None:
+        print("   ❌ Error: class stats/recommendations could not be loaded")
         return False
-    finally:
-        db.close()
+    
+    # Test class stats
+    print("\n📊 Testing /api/class/stats...")
+    
+    checks = []
+    checks.append(("Total students", stats.total_students == 25, f"Found {stats.total_students}, expected 25"))
+    checks.append(("Average mastery", 0 <= stats.avg_vocab_mastery_percent <= 100, f"Found {stats.avg_vocab_mastery_percent:.1f}%"))
+    checks.append(("Reading level distribution", len(stats.reading_level_distribution) > 0, f"Found {len(stats.reading_level_distribution)} levels"))
+    checks.append(("Top missing words", len(stats.top_missing_words) > 0, f"Found {len(stats.top_missing_words)} words"))
+    checks.append(("Commonly misused words", len(stats.commonly_misused_words) >= 0, f"Found {len(stats.commonly_misused_words)} words"))
+    
+    for name, passed, msg in checks:
+        status = "✅" if passed else "❌"
+        print(f"   {status} {name}: {msg}")
+    
+    # Test class recommendations
+    print("\n📖 Testing /api/class/recommendations...")
+    
+    rec_checks = []
+    rec_checks.append(("Recommendations exist", len(recs) > 0, f"Found {len(recs)} recommendations"))
+    rec_checks.append(("Max 2 recommendations", len(recs) <= 2, f"Found {len(recs)}, max is 2"))
+    
+    if recs:
+        rec_checks.append(("Book titles present", all(r.title for r in recs), "All have titles"))
+        rec_checks.append(("Student counts valid", all(0 < r.students_recommended_count <= 25 for r in recs), "All counts valid"))
+        rec_checks.append(("Match scores valid", all(0 <= r.avg_match_score <= 1 for r in recs), "All scores valid"))
+    
+    for name, passed, msg in rec_checks:
+        status = "✅" if passed else "❌"
+        print(f"   {status} {name}: {msg}")
+    
+    return all(p for _, p, _ in checks + rec_checks)
 
 
-def check_database():
+def check_database(counts):
     """Verify database has expected data."""
     print("\n" + "=" * 70)
     print("2. Database Verification")
     print("=" * 70)
     
-    db = SessionLocal()
-    try:
-        # Check students
-        student_count = db.query(Student).count()
-        print(f"\n👥 Students: {student_count} (expected: 25)")
-        
-        if student_count != 25:
-            print("   ⚠️  Warning: Expected 25 students!")
-        
-        # Check vocabulary data
-        vocab_count = db.query(StudentVocabulary).count()
-        students_with_vocab = db.query(StudentVocabulary.student_id).distinct().count()
-        print(f"📚 Vocabulary entries: {vocab_count}")
-        print(f"   Students with vocab data: {students_with_vocab}/25")
-        
-        # Check recommendations
-        rec_count = db.query(StudentRecommendation).count()
-        students_with_recs = db.query(StudentRecommendation.student_id).distinct().count()
-        print(f"📖 Recommendations: {rec_count}")
-        print(f"   Students with recommendations: {students_with_recs}/25")
-        
-        # Reading level distribution
-        print(f"\n📈 Reading level distribution:")
-        for level in [5, 6, 7, 8]:
-            count = db.query(Student).filter(Student.actual_reading_level == level).count()
-            print(f"   Grade {level}: {count} students")
-        
-        return student_count == 25 and vocab_count > 0 and rec_count > 0
-        
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    if counts is None:
+        print("   ❌ Error: database counts could not be loaded")
         return False
-    finally:
-        db.close()
+    
+    student_count = counts["student_count"]
+    vocab_count = counts["vocab_count"]
+    rec_count = counts["rec_count"]
+    
+    # Check students
+    print(f"\n👥 Students: {student_count} (expected: 25)")
+    
+    if student_count != 25:
+        print("   ⚠️  Warning: Expected 25 students!")
+    
+    # Check vocabulary data
+    print(f"📚 Vocabulary entries: {vocab_count}")
+    print(f"   Students with vocab data: {counts['students_with_vocab']}/25")
+    
+    # Check recommendations
+    print(f"📖 Recommendations: {rec_count}")
+    print(f"   Students with recommendations: {counts['students_with_recs']}/25")
+    
+    # Reading level distribution
+    print(f"\n📈 Reading level distribution:")
+    level_counts = counts["level_counts"]
+    for level in [5, 6, 7, 8]:
+        print(f"   Grade {level}: {level_counts[level]} students")
+    other = sum(level_counts.values()) - sum(level_counts[level] for level in [5, 6, 7, 8])
+    if other:
+        print(f"   Other levels: {other} students")
+    
+    return student_count == 25 and vocab_count > 0 and rec_count > 0
 
 
-def check_data_structure():
+def check_data_structure(stats, recs):
     """Verify data structure matches frontend expectations."""
     print("\n" + "=" * 70)
     print("3. Data Structure Verification")
     print("=" * 70)
     
-    db = SessionLocal()
+    if stats is None or recs is None:
+        print("   ❌ Error: class stats/recommendations could not be loaded")
+        return False
+    
     try:
-        stats = get_class_stats(db)
-        
         # Check ClassStatsResponse structure
         required_fields = [
             'total_students',
@@ -153,7 +192,6 @@ def check_data_structure():
             print(f"   ✅ misuse_count: {hasattr(misused, 'misuse_count')}")
         
         # Check ClassRecommendationResponse structure
-        recs = get_class_recommendations(db)
         if recs:
             rec = recs[0]
             print(f"\n📋 ClassRecommendationResponse fields:")
@@ -170,25 +208,48 @@ def check_data_structure():
         
     except Exception as e:
         print(f"   ❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        db.close()
 
 
 def main():
     """Run all verification checks."""
+    # Don't fail on emoji when stdout isn't UTF-8 (e.g. Windows consoles, some CI logs)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="backslashreplace")
+    
     print("=" * 70)
     print("Class View Implementation Verification")
     print("=" * 70)
     
     results = []
     
+    # The three loads are independent read-only queries: run them concurrently,
+    # each in its own session, and load stats/recommendations once for all checks
+    loaders = {
+        "class stats": get_class_stats,
+        "class recommendations": get_class_recommendations,
+        "database counts": get_database_counts,
+    }
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {name: executor.submit(run_with_session, fn) for name, fn in loaders.items()}
+    
+    loaded = {}
+    for name, future in futures.items():
+        try:
+            loaded[name] = future.result()
+        except Exception as e:
+            print(f"\n❌ Error loading {name}: {e}")
+            traceback.print_exception(type(e), e, e.__traceback__)
+            loaded[name] = None
+    
+    stats = loaded["class stats"]
+    recs = loaded["class recommendations"]
+    
     # Run checks
-    results.append(("Backend API", check_backend_api()))
-    results.append(("Database", check_database()))
-    results.append(("Data Structure", check_data_structure()))
+    results.append(("Backend API", check_backend_api(stats, recs)))
+    results.append(("Database", check_database(loaded["database counts"])))
+    results.append(("Data Structure", check_data_structure(stats, recs)))
     
     # Summary
     print("\n" + "=" * 70)
@@ -6,26 +6,53 @@ This script checks that the pgcorpus dataset has been properly set up
 and is ready for use in the book seeding process.
 
 Usage:
-    python scripts/verify_pgcorpus.py [path_to_gutenberg_repo]
+    python scripts/verify_pgcorpus.py [path_to_gutenberg_repo] [--full]
     
     If no path provided, assumes: ./gutenberg
+    --full also counts every file in data/counts (slow on a full corpus)
 """
 
+import csv
+import functools
+import importlib.util
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def check_mark(condition, message):
+@functools.lru_cache(maxsize=None)
+def _stat(path_str):
+    """os.stat() memoized per path for the run; None if the path doesn't exist."""
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+
+def path_exists(path) -> bool:
+    """Path.exists() backed by the memoized stat cache."""
+    return _stat(str(path)) is not None
+
+
+def display_path(path, root) -> str:
+    """path relative to root for display, by prefix strip (no normalization)."""
+    prefix = str(root) + os.sep
+    path_str = str(path)
+    return path_str[len(prefix):] if path_str.startswith(prefix) else path_str
+
+
+def check_mark(condition, message, out=None):
     """Print a checkmark or X based on condition."""
     symbol = "✅" if condition else "❌"
-    print(f"{symbol} {message}")
+    print(f"{symbol} {message}", file=out)
     return condition
 
 
-def verify_repository_structure(gutenberg_path):
+def verify_repository_structure(gutenberg_path, out=None):
     """Verify the repository has the expected structure."""
-    print("\n📁 Verifying Repository Structure...")
+    print("\n📁 Verifying Repository Structure...", file=out)
     
     required_files = [
         "get_data.py",
@@ -37,86 +64,117 @@ def verify_repository_structure(gutenberg_path):
     for file in required_files:
         file_path = gutenberg_path / file
         all_passed &= check_mark(
-            file_path.exists(),
-            f"{file} exists"
+            path_exists(file_path),
+            f"{file} exists",
+            out
         )
     
     return all_passed
 
 
-def verify_dependencies():
+def verify_dependencies(out=None):
     """Verify required Python packages are installed."""
-    print("\n📦 Verifying Dependencies...")
-    
-    try:
-        import pandas
-        check_mark(True, "pandas installed")
-    except ImportError:
-        check_mark(False, "pandas not installed")
-        return False
+    print("\n📦 Verifying Dependencies...", file=out)
     
-    try:
-        import numpy
-        check_mark(True, "numpy installed")
-    except ImportError:
-        check_mark(False, "numpy not installed")
-        return False
+    # find_spec only locates the package; importing pandas would cost far more
+    for package in ("pandas", "numpy"):
+        if importlib.util.find_spec(package) is None:
+            check_mark(False, f"{package} not installed", out)
+            return False
+        check_mark(True, f"{package} installed", out)
     
     return True
 
 
-def verify_data_download(gutenberg_path):
+def verify_data_download(gutenberg_path, out=None):
     """Verify data has been downloaded."""
-    print("\n⬇️  Verifying Data Download...")
+    print("\n⬇️  Verifying Data Download...", file=out)
     
     mirror_path = gutenberg_path / ".mirror"
     raw_path = gutenberg_path / "data" / "raw"
     
-    mirror_exists = mirror_path.exists() and any(mirror_path.iterdir())
-    raw_exists = raw_path.exists() and any(raw_path.iterdir())
+    mirror_exists = path_exists(mirror_path) and any(mirror_path.iterdir())
+    raw_exists = path_exists(raw_path) and any(raw_path.iterdir())
     
-    check_mark(mirror_exists, f".mirror folder exists and has content")
-    check_mark(raw_exists, f"data/raw folder exists and has content")
+    check_mark(mirror_exists, f".mirror folder exists and has content", out)
+    check_mark(raw_exists, f"data/raw folder exists and has content", out)
     
     return mirror_exists or raw_exists
 
 
-def verify_processing(gutenberg_path):
-    """Verify data has been processed."""
-    print("\n⚙️  Verifying Data Processing...")
-    
+def scan_counts_dir(gutenberg_path, full=False):
+    """
+    Scan data/counts and read the sample file once for the stages that need it.
+    
+    Returns:
+        None if data/counts doesn't exist, else a dict with:
+        - sample: first regular file (DirEntry), or None
+        - file_count: number of files, or None unless full=True
+          (otherwise the scan stops at the first file)
+        - lines: first 5 lines of the sample file (stripped)
+        - error: exception raised while reading the sample file, if any
+    """
     counts_path = gutenberg_path / "data" / "counts"
     
-    if not counts_path.exists():
-        check_mark(False, "data/counts folder does not exist")
+    if not path_exists(counts_path):
+        return None
+    
+    # DirEntry.is_file() uses the type from the directory read (no stat per entry)
+    scan = {"sample": None, "file_count": None, "lines": [], "error": None}
+    with os.scandir(counts_path) as it:
+        scan["sample"] = next((entry for entry in it if entry.is_file(follow_symlinks=False)), None)
+        if full:
+            scan["file_count"] = 0
+            if scan["sample"] is not None:
+                scan["file_count"] = 1 + sum(1 for entry in it if entry.is_file(follow_symlinks=False))
+    
+    if scan["sample"] is not None:
+        try:
+            with open(scan["sample"].path, 'r') as f:
+                scan["lines"] = [f.readline().strip() for _ in range(5)]
+        except Exception as e:
+            scan["error"] = e
+    
+    return scan
+
+
+def verify_processing(counts_scan, out=None):
+    """Verify data has been processed."""
+    print("\n⚙️  Verifying Data Processing...", file=out)
+    
+    if counts_scan is None:
+        check_mark(False, "data/counts folder does not exist", out)
         return False
     
-    count_files = list(counts_path.glob("*"))
-    count_files = [f for f in count_files if f.is_file()]
+    sample_file = counts_scan["sample"]
+    file_count = counts_scan["file_count"]
     
-    has_files = len(count_files) > 0
-    check_mark(has_files, f"data/counts has {len(count_files)} files")
+    has_files = sample_file is not None
+    if not has_files:
+        check_mark(False, "data/counts has no files", out)
+    elif file_count is not None:
+        check_mark(True, f"data/counts has {file_count} files", out)
+    else:
+        check_mark(True, "data/counts has files (use --full to count them)", out)
     
     if has_files:
-        # Try to read a sample file
-        sample_file = count_files[0]
-        try:
-            with open(sample_file, 'r') as f:
-                first_line = f.readline().strip()
-                check_mark(
-                    len(first_line) > 0,
-                    f"Sample counts file is readable: {sample_file.name}"
-                )
-        except Exception as e:
-            check_mark(False, f"Error reading sample file: {e}")
+        # Check the sample file was readable
+        if counts_scan["error"] is not None:
+            check_mark(False, f"Error reading sample file: {counts_scan['error']}", out)
             return False
+        first_line = counts_scan["lines"][0]
+        check_mark(
+            len(first_line) > 0,
+            f"Sample counts file is readable: {sample_file.name}",
+            out
+        )
     
     return has_files
 
 
-def verify_metadata(gutenberg_path):
+def verify_metadata(gutenberg_path, out=None):
     """Verify metadata CSV exists and is readable."""
-    print("\n📊 Verifying Metadata CSV...")
+    print("\n📊 Verifying Metadata CSV...", file=out)
     
     # Try common locations
     possible_paths = [
@@ -127,85 +185,95 @@ def verify_metadata(gutenberg_path):
     
     metadata_path = None
     for path in possible_paths:
-        if path.exists():
+        if path_exists(path):
             metadata_path = path
             break
     
     if not metadata_path:
-        check_mark(False, "Metadata CSV not found in common locations")
+        check_mark(False, "Metadata CSV not found in common locations", out)
         return False
     
-    check_mark(True, f"Metadata CSV found: {metadata_path.relative_to(gutenberg_path)}")
+    check_mark(True, f"Metadata CSV found: {display_path(metadata_path, gutenberg_path)}", out)
     
     # Try to read it
     try:
-        import pandas as pd
-        df = pd.read_csv(metadata_path)
-        check_mark(True, f"Metadata CSV readable: {len(df)} books")
+        # Only the header and the row count are needed: stream the rows through
+        # the C csv reader (handles quoted newlines) without building a DataFrame
+        with open(metadata_path, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            columns = next(reader, [])
+            row_count = sum(1 for row in reader if row)
+        check_mark(True, f"Metadata CSV readable: {row_count} books", out)
         check_mark(
-            "gutenberg_id" in df.columns or "id" in df.columns,
-            "Metadata has gutenberg_id column"
+            "gutenberg_id" in columns or "id" in columns,
+            "Metadata has gutenberg_id column",
+            out
         )
         return True
     except Exception as e:
-        check_mark(False, f"Error reading metadata CSV: {e}")
+        check_mark(False, f"Error reading metadata CSV: {e}", out)
         return False
 
 
-def verify_counts_format(gutenberg_path):
+def verify_counts_format(counts_scan, out=None):
     """Verify counts files have correct format."""
-    print("\n📝 Verifying Counts File Format...")
+    print("\n📝 Verifying Counts File Format...", file=out)
     
-    counts_path = gutenberg_path / "data" / "counts"
+    if counts_scan is None or counts_scan["sample"] is None:
+        return False
     
-    if not counts_path.exists():
+    # Test the sample file's lines (read once by scan_counts_dir)
+    if counts_scan["error"] is not None:
+        check_mark(False, f"Error reading counts file: {counts_scan['error']}", out)
         return False
     
-    count_files = [f for f in counts_path.iterdir() if f.is_file()]
+    lines = [l for l in counts_scan["lines"] if l]  # Remove empty lines
     
-    if not count_files:
+    if not lines:
+        check_mark(False, "Sample counts file appears empty", out)
         return False
     
-    # Test reading a sample file
-    sample_file = count_files[0]
+    # Check format (space/tab separated or JSON)
+    first_line = lines[0]
+    is_valid = False
+    
+    # Check for space/tab separated
+    parts = first_line.split()
+    if len(parts) >= 2:
+        # Try to parse count as number
+        try:
+            int(parts[-1])
+            is_valid = True
+        except ValueError:
+            pass
+    
+    # Check for JSON
+    if not is_valid and first_line.startswith("{"):
+        try:
+            import json
+            json.loads(first_line)
+            is_valid = True
+        except:
+            pass
+    
+    check_mark(is_valid, f"Counts file format appears valid", out)
+    return is_valid
+
+
+def run_captured(stage, *args):
+    """
+    Run a verification stage with its own output buffer.
+    
+    Returns (passed, printed output). A stage that raises is reported as failed,
+    keeping whatever it printed before the error.
+    """
+    out = io.StringIO()
     try:
-        with open(sample_file, 'r') as f:
-            lines = [f.readline().strip() for _ in range(5)]
-            lines = [l for l in lines if l]  # Remove empty lines
-            
-            if not lines:
-                check_mark(False, "Sample counts file appears empty")
-                return False
-            
-            # Check format (space/tab separated or JSON)
-            first_line = lines[0]
-            is_valid = False
-            
-            # Check for space/tab separated
-            parts = first_line.split()
-            if len(parts) >= 2:
-                # Try to parse count as number
-                try:
-                    int(parts[-1])
-                    is_valid = True
-                except ValueError:
-                    pass
-            
-            # Check for JSON
-            if not is_valid and first_line.startswith("{"):
-                try:
-                    import json
-                    json.loads(first_line)
-                    is_valid = True
-                except:
-                    pass
-            
-            check_mark(is_valid, f"Counts file format appears valid")
-            return is_valid
-            
+        passed = stage(*args, out=out)
     except Exception as e:
-        check_mark(False, f"Error reading counts file: {e}")
-        return False
+        check_mark(False, f"Unexpected error: {e}", out)
+        passed = False
+    return passed, out.getvalue()
 
 
 def main():
@@ -214,15 +282,17 @@ def main():
     print("pgcorpus/gutenberg Setup Verification")
     print("=" * 60)
     
-    # Get gutenberg path
-    if len(sys.argv) > 1:
-        gutenberg_path = Path(sys.argv[1])
+    # Get gutenberg path and options
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    full = "--full" in sys.argv[1:]
+    if args:
+        gutenberg_path = Path(args[0])
     else:
         gutenberg_path = Path("gutenberg")
     
-    if not gutenberg_path.exists():
+    if not path_exists(gutenberg_path):
         print(f"\n❌ Error: Gutenberg repository not found at: {gutenberg_path}")
-        print(f"\nUsage: python {sys.argv[0]} [path_to_gutenberg_repo]")
+        print(f"\nUsage: python {sys.argv[0]} [path_to_gutenberg_repo] [--full]")
         print(f"   or: python {sys.argv[0]}  (assumes ./gutenberg)")
         sys.exit(1)
     
@@ -230,13 +300,29 @@ def main():
     
     results = []
     
-    # Run all checks
-    results.append(("Repository Structure", verify_repository_structure(gutenberg_path)))
-    results.append(("Dependencies", verify_dependencies()))
-    results.append(("Data Download", verify_data_download(gutenberg_path)))
-    results.append(("Data Processing", verify_processing(gutenberg_path)))
-    results.append(("Metadata CSV", verify_metadata(gutenberg_path)))
-    results.append(("Counts Format", verify_counts_format(gutenberg_path)))
+    # data/counts is scanned once and shared by the processing and format checks
+    counts_scan = scan_counts_dir(gutenberg_path, full)
+    stages = [
+        ("Repository Structure", verify_repository_structure, (gutenberg_path,)),
+        ("Dependencies", verify_dependencies, ()),
+        ("Data Download", verify_data_download, (gutenberg_path,)),
+        ("Data Processing", verify_processing, (counts_scan,)),
+        ("Metadata CSV", verify_metadata, (gutenberg_path,)),
+        ("Counts Format", verify_counts_format, (counts_scan,)),
+    ]
+    
+    # Run all checks concurrently (they are independent and mostly wait on disk)
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        futures = [
+            (name, executor.submit(run_captured, stage, *stage_args))
+            for name, stage, stage_args in stages
+        ]
+        outputs = [(name, future.result()) for name, future in futures]
+    
+    # Print each stage's captured output in the usual order
+    for name, (passed, output) in outputs:
+        sys.stdout.write(output)
+        results.append((name, passed))
     
     # Summary
     print("\n" + "=" * 60)
@@ -3,11 +3,14 @@
 Quick verification script to check if database has necessary data.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import func, select
+
 from app.database import SessionLocal, init_db
 from app.models import (
     Student,
@@ -17,6 +20,15 @@ from app.models import (
     BookVocabulary,
 )
 
+def count_rows(statement) -> int:
+    """Run a COUNT statement in its own session (sessions must not be shared across threads)."""
+    db = SessionLocal()
+    try:
+        return db.execute(statement).scalar()
+    finally:
+        db.close()
+
+
 def verify_prerequisites():
     """Check if database has necessary data for recommendations."""
     print("=" * 70)
@@ -24,11 +36,28 @@ def verify_prerequisites():
     print("=" * 70)
     
     init_db()
-    db = SessionLocal()
     
     try:
+        # Count each table concurrently on its own connection: the large vocabulary
+        # tables dominate, and one statement would scan them one after another
+        statements = [
+            select(func.count()).select_from(VocabularyWord),
+            select(func.count()).select_from(Book),
+            select(func.count()).select_from(BookVocabulary),
+            select(func.count()).select_from(Student),
+            select(func.count()).select_from(StudentVocabulary)
+            .where(StudentVocabulary.correct_usage_count > 0),
+        ]
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            (
+                vocab_count,
+                books_count,
+                book_vocab_count,
+                students_count,
+                student_vocab_count,
+            ) = executor.map(count_rows, statements)
+        
         # Check vocabulary words
-        vocab_count = db.query(VocabularyWord).count()
         print(f"\n📚 Vocabulary Words: {vocab_count}")
         if vocab_count == 0:
             print("   ❌ No vocabulary words found. Run: python scripts/seed_vocabulary.py")
@@ -37,7 +66,6 @@ def verify_prerequisites():
             print("   ✅ Vocabulary words loaded")
         
         # Check books
-        books_count = db.query(Book).count()
         print(f"\n📖 Books: {books_count}")
         if books_count == 0:
             print("   ❌ No books found. Run: python scripts/seed_books.py")
@@ -46,7 +74,6 @@ def verify_prerequisites():
             print("   ✅ Books loaded")
         
         # Check book vocabulary
-        book_vocab_count = db.query(BookVocabulary).count()
         print(f"\n📝 Book Vocabulary Records: {book_vocab_count}")
         if book_vocab_count == 0:
             print("   ❌ No book vocabulary found. Run: python scripts/seed_books.py")
@@ -55,7 +82,6 @@ def verify_prerequisites():
             print("   ✅ Book vocabulary loaded")
         
         # Check students
-        students_count = db.query(Student).count()
         print(f"\n👥 Students: {students_count}")
         if students_count == 0:
             print("   ❌ No students found. Run: python scripts/analyze_students.py")
@@ -64,9 +90,6 @@ def verify_prerequisites():
             print("   ✅ Students loaded")
         
         # Check student vocabulary
-        student_vocab_count = db.query(StudentVocabulary).filter(
-            StudentVocabulary.correct_usage_count > 0
-        ).count()
         print(f"\n📊 Student Vocabulary (known words): {student_vocab_count}")
         if student_vocab_count == 0:
             print("   ❌ No student vocabulary profiles found. Run: python scripts/analyze_students.py")
@@ -84,8 +107,6 @@ def verify_prerequisites():
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     if verify_prerequisites():
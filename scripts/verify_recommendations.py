@@ -8,6 +8,8 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import func, select
+
 from app.database import SessionLocal, init_db
 from app.models import StudentRecommendation, ClassRecommendation, Student, Book
 
@@ -21,8 +23,13 @@ def verify_recommendations():
     db = SessionLocal()
     
     try:
+        # Fetch both recommendation counts in one round trip
+        student_recs, class_recs = db.execute(select(
+            select(func.count()).select_from(StudentRecommendation).scalar_subquery(),
+            select(func.count()).select_from(ClassRecommendation).scalar_subquery(),
+        )).one()
+        
         # Count student recommendations
-        student_recs = db.query(StudentRecommendation).count()
         print(f"\n📊 Student Recommendations: {student_recs} (expected: 75)")
         if student_recs == 75:
             print("   ✅ Count matches expected")
@@ -30,18 +37,21 @@ def verify_recommendations():
             print(f"   ⚠️  Count differs from expected")
         
         # Count class recommendations
-        class_recs = db.query(ClassRecommendation).count()
         print(f"\n📚 Class Recommendations: {class_recs} (expected: 2)")
         if class_recs == 2:
             print("   ✅ Count matches expected")
         else:
             print(f"   ⚠️  Count differs from expected")
         
-        # Check sample student recommendation
-        sample = db.query(StudentRecommendation).first()
-        if sample:
-            student = db.query(Student).filter(Student.id == sample.student_id).first()
-            book = db.query(Book).filter(Book.id == sample.book_id).first()
+        # Check sample student recommendation (with its student and book in one query)
+        sample_row = (
+            db.query(StudentRecommendation, Student, Book)
+            .join(Student, Student.id == StudentRecommendation.student_id)
+            .join(Book, Book.id == StudentRecommendation.book_id)
+            .first()
+        )
+        if sample_row:
+            sample, student, book = sample_row
             print(f"\n📝 Sample Student Recommendation:")
             print(f"   Student: {student.name}")
             print(f"   Book: {book.title[:60]}")
@@ -56,40 +66,47 @@ def verify_recommendations():
                 print("   ❌ Match score out of range")
         
         # Check class recommendations
-        class_recs_list = db.query(ClassRecommendation).order_by(
-            ClassRecommendation.students_recommended_count.desc()
-        ).all()
+        class_recs_list = (
+            db.query(ClassRecommendation, Book)
+            .join(Book, Book.id == ClassRecommendation.book_id)
+            .order_by(ClassRecommendation.students_recommended_count.desc())
+            .all()
+        )
         print(f"\n📖 Class-Wide Recommendations:")
-        for i, rec in enumerate(class_recs_list, 1):
-            book = db.query(Book).filter(Book.id == rec.book_id).first()
+        for i, (rec, book) in enumerate(class_recs_list, 1):
             print(f"   {i}. {book.title[:60]}")
             print(f"      Recommended to: {rec.students_recommended_count} students")
             print(f"      Average match score: {rec.match_score:.3f}")
         
         # Check for duplicate recommendations per student
         print(f"\n🔍 Checking for duplicate recommendations per student...")
-        students = db.query(Student).all()
-        duplicates_found = False
-        for student in students:
-            recs = db.query(StudentRecommendation).filter(
-                StudentRecommendation.student_id == student.id
-            ).all()
-            book_ids = [rec.book_id for rec in recs]
-            if len(book_ids) != len(set(book_ids)):
-                print(f"   ⚠️  Student {student.name} has duplicate book recommendations")
-                duplicates_found = True
+        # Students recommended the same book more than once, found by the database
+        duplicate_students = (
+            db.query(Student.id, Student.name)
+            .join(StudentRecommendation, StudentRecommendation.student_id == Student.id)
+            .group_by(Student.id, Student.name, StudentRecommendation.book_id)
+            .having(func.count() > 1)
+            .distinct()
+            .all()
+        )
+        for _, name in duplicate_students:
+            print(f"   ⚠️  Student {name} has duplicate book recommendations")
         
-        if not duplicates_found:
+        if not duplicate_students:
             print("   ✅ No duplicate recommendations per student")
         
         # Verify all students have 3 recommendations
         print(f"\n👥 Checking student recommendation counts...")
+        students = db.query(Student.id, Student.name).all()
+        rec_counts = dict(
+            db.query(StudentRecommendation.student_id, func.count())
+            .group_by(StudentRecommendation.student_id)
+            .all()
+        )
         students_with_3 = 0
         students_with_less = []
         for student in students:
-            rec_count = db.query(StudentRecommendation).filter(
-                StudentRecommendation.student_id == student.id
-            ).count()
+            rec_count = rec_counts.get(student.id, 0)
             if rec_count == 3:
                 students_with_3 += 1
             else: